@@ -0,0 +1,60 @@
+#!/usr/bin/python
+
+# Measures decoding time of glTF accessors with interleaved and tightly packed buffer views
+
+import os.path
+import sys
+import time
+
+import numpy
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'usdzconvert'))
+import usdStageWithGlTF
+
+
+class BenchmarkData:
+    # minimal stand-in for glTFConverter: Accessor needs .gltf, .buffers and getBufferView() only
+    def __init__(self, count, interleaved):
+        positions = numpy.random.rand(count, 3).astype(numpy.float32)
+        normals = numpy.random.rand(count, 3).astype(numpy.float32)
+        uvs = numpy.random.rand(count, 2).astype(numpy.float32)
+        if interleaved:
+            content = numpy.concatenate((positions, normals, uvs), axis=1)
+            bufferViews = [{'buffer': 0, 'byteLength': content.nbytes, 'byteStride': 32}]
+            accessors = [
+                {'bufferView': 0, 'byteOffset': 0, 'componentType': 5126, 'count': count, 'type': 'VEC3'},
+                {'bufferView': 0, 'byteOffset': 12, 'componentType': 5126, 'count': count, 'type': 'VEC3'},
+                {'bufferView': 0, 'byteOffset': 24, 'componentType': 5126, 'count': count, 'type': 'VEC2'}]
+            self.buffers = [content.tobytes()]
+        else:
+            bufferViews = [
+                {'buffer': 0, 'byteOffset': 0, 'byteLength': positions.nbytes},
+                {'buffer': 0, 'byteOffset': positions.nbytes, 'byteLength': normals.nbytes},
+                {'buffer': 0, 'byteOffset': positions.nbytes + normals.nbytes, 'byteLength': uvs.nbytes}]
+            accessors = [
+                {'bufferView': 0, 'componentType': 5126, 'count': count, 'type': 'VEC3'},
+                {'bufferView': 1, 'componentType': 5126, 'count': count, 'type': 'VEC3'},
+                {'bufferView': 2, 'componentType': 5126, 'count': count, 'type': 'VEC2'}]
+            self.buffers = [positions.tobytes() + normals.tobytes() + uvs.tobytes()]
+        self.gltf = {'accessors': accessors, 'bufferViews': bufferViews}
+
+
+    def getBufferView(self, bufferViewIdx):
+        return usdStageWithGlTF.glTFConverter.getBufferView(self, bufferViewIdx)
+
+
+def measure(count, interleaved, repeats=5):
+    gltfData = BenchmarkData(count, interleaved)
+    best = float('inf')
+    for i in range(repeats):
+        start = time.time()
+        for accessorIdx in range(len(gltfData.gltf['accessors'])):
+            usdStageWithGlTF.Accessor(gltfData, accessorIdx)
+        best = min(best, time.time() - start)
+    return best
+
+
+counts = [int(arg) for arg in sys.argv[1:]] if len(sys.argv) > 1 else [10000, 100000, 1000000]
+print('vertices'.rjust(10) + 'packed, sec'.rjust(16) + 'interleaved, sec'.rjust(20))
+for count in counts:
+    print(str(count).rjust(10) + ('%.4f' % measure(count, False)).rjust(16) + ('%.4f' % measure(count, True)).rjust(20))
@@ -27,11 +27,6 @@ class iOS12LegacyModifier:
         return rot.Decompose(Gf.Vec3d(1, 0, 0), Gf.Vec3d(0, 1, 0), Gf.Vec3d(0, 0, 1))
 
 
-    def getEulerFromData(self, data, offset):
-        quat = Gf.Quatf(float(data[offset + 3]), Gf.Vec3f(float(data[offset]), float(data[offset + 1]), float(data[offset + 2])))
-        return self.eulerWithQuat(quat)
-
-
     def makeOneChannelTexture(self, srcFile, dstFolder, channel, verbose):
         if not _pilLibraryLoaded:
             return ''
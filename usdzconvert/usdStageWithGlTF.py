@@ -5,6 +5,9 @@ import struct
 import os.path
 import base64
 import math
+import urllib.parse
+import mmap
+from collections import OrderedDict
 
 import usdUtils
 
@@ -19,6 +22,9 @@ except Exception as e:
 __all__ = ['usdStageWithGlTF']
 
 
+ACCESSOR_CACHE_MAX_BYTES = 512 * 1024 * 1024 # decoded accessors kept for reuse
+
+
 class glTFComponentType:
     BYTE = 5120
     UNSIGNED_BYTE = 5121
@@ -32,7 +38,7 @@ class glTFComponentType:
 
     def unpackFormat(self):
         return {
-            glTFComponentType.BYTE: numpy.uint8,
+            glTFComponentType.BYTE: numpy.int8,
             glTFComponentType.UNSIGNED_BYTE: numpy.uint8,
             glTFComponentType.SHORT: numpy.int16,
             glTFComponentType.UNSIGNED_SHORT: numpy.uint16,
@@ -52,6 +58,16 @@ class glTFComponentType:
             } [self.type]        
 
 
+    def normalizationScale(self):
+        # normalized integers are mapped to [0, 1] or [-1, 1] floats by glTF spec
+        return {
+            glTFComponentType.BYTE: 127.0,
+            glTFComponentType.UNSIGNED_BYTE: 255.0,
+            glTFComponentType.SHORT: 32767.0,
+            glTFComponentType.UNSIGNED_SHORT: 65535.0
+            } [self.type]
+
+
 class glFTTextureFilter: # TODO: support
     NEAREST = 9728
     LINEAR = 9729
@@ -105,6 +121,22 @@ def numOfComponents(strType):
     return 1
 
 
+def isDataUri(uri):
+    return uri[:5] == 'data:'
+
+
+def parseDataUri(uri):
+    # data:[<mime type>][;base64],<data>
+    headerEnd = uri.find(',')
+    if headerEnd == -1:
+        return ('', b'')
+    header = uri[5:headerEnd]
+    if header.endswith(';base64'):
+        return (header[:-7], base64.b64decode(uri[(headerEnd + 1):]))
+    mimeType = header.split(';')[0]
+    return (mimeType, urllib.parse.unquote_to_bytes(uri[(headerEnd + 1):]))
+
+
 def getName(dict, template, id):
     if 'name' in dict and len(dict['name']) != 0:
         validName = usdUtils.makeValidIdentifier(dict['name'])
@@ -123,12 +155,6 @@ def getVec3(v):
     return Gf.Vec3d(v[0], v[1], v[2])
 
 
-def getVec4(v):
-    if len(v) == 4:
-        return Gf.Vec4d(v[0], v[1], v[2], v[3])
-    return Gf.Vec4d(v[0], v[1], v[2], 1)
-
-
 def getQuat(v):
     return Gf.Quatf(v[3], Gf.Vec3f(v[0], v[1], v[2]))
 
@@ -137,83 +163,154 @@ def getMatrix(m):
     return Gf.Matrix4d((m[0], m[1], m[2], m[3]), (m[4], m[5], m[6], m[7]), (m[8], m[9], m[10], m[11]), (m[12], m[13], m[14], m[15]))
 
 
-def getMatrixTransform(gltfNode):
-    if 'matrix' in gltfNode:
-        matrix = getMatrix(gltfNode['matrix'])
-    else:
-        if 'scale' in gltfNode:
-            matrix = Gf.Matrix4d(getVec4(gltfNode['scale']))
-        else:
-            matrix = Gf.Matrix4d(1)
-
-        if 'rotation' in gltfNode:
-            matRot = Gf.Matrix4d()
-            matRot.SetRotate(getQuat(gltfNode['rotation']))
-            matrix = matrix * matRot
-
+def getLocalMatrices(gltfNodes):
+    # local transforms of all nodes as (nodes, 4, 4) array in Gf.Matrix4d layout: scale * rotation * translation
+    count = len(gltfNodes)
+    translations = numpy.zeros((count, 3))
+    rotations = numpy.zeros((count, 4))
+    rotations[:, 3] = 1
+    scales = numpy.ones((count, 3))
+    matrixNodes = []
+    for nodeIdx, gltfNode in enumerate(gltfNodes):
+        if 'matrix' in gltfNode:
+            matrixNodes.append(nodeIdx)
+            continue
         if 'translation' in gltfNode:
-            matTr = Gf.Matrix4d()
-            matTr.SetTranslate(getVec3(gltfNode['translation']))
-            matrix = matrix * matTr 
-    return matrix
-
-
-def getTransformTranslation(gltfNode):
-    if 'translation' in gltfNode:
-        translation = gltfNode['translation']
-        return Gf.Vec3f(translation[0], translation[1], translation[2])
-    else:
-        return Gf.Vec3f(0, 0, 0) # TODO: support decomposition?
-
-
-def getTransformRotation(gltfNode):
-    if 'rotation' in gltfNode:
-        rotation = gltfNode['rotation']
-        return Gf.Quatf(rotation[3], Gf.Vec3f(rotation[0], rotation[1], rotation[2]))
-    else:
-        return Gf.Quatf(1, Gf.Vec3f(0, 0, 0)) # TODO: support decomposition?
-
-
-def getTransformScale(gltfNode):
-    if 'scale' in gltfNode:
-        scale = gltfNode['scale']
-        return Gf.Vec3f(scale[0], scale[1], scale[2])
-    else:
-        return Gf.Vec3f(1, 1, 1) # TODO: support decomposition?
-
-
-def getInterpolatedValue(timeValueDic, time, isSlerp=False):
-    if time in timeValueDic:
-        return timeValueDic[time]
-    # find neighbor keys for time
-    # to get an interpolated value
-    lessMaxTime = -1
-    greaterMinTime = -1
-    for t in timeValueDic:
-        if t < time:
-            if lessMaxTime == -1:
-                lessMaxTime = t
-            elif lessMaxTime < t:
-                lessMaxTime = t
-        elif t > time:
-            if greaterMinTime == -1:
-                greaterMinTime = t
-            elif greaterMinTime > t:
-                greaterMinTime = t
-
-    if lessMaxTime == -1:
-        return timeValueDic[greaterMinTime]
-    if greaterMinTime == -1:
-        return timeValueDic[lessMaxTime]
-
-    k = float(time - lessMaxTime) / (greaterMinTime - lessMaxTime)
-
+            translations[nodeIdx] = gltfNode['translation']
+        if 'rotation' in gltfNode:
+            rotations[nodeIdx] = gltfNode['rotation']
+        if 'scale' in gltfNode:
+            scales[nodeIdx] = gltfNode['scale']
+
+    # same as Gf.Matrix4d.SetRotate(Gf.Quatf)
+    x, y, z, w = rotations.astype(numpy.float32).astype(numpy.float64).T
+    matrices = numpy.zeros((count, 4, 4))
+    matrices[:, 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    matrices[:, 0, 1] = 2.0 * (x * y + z * w)
+    matrices[:, 0, 2] = 2.0 * (z * x - y * w)
+    matrices[:, 1, 0] = 2.0 * (x * y - z * w)
+    matrices[:, 1, 1] = 1.0 - 2.0 * (z * z + x * x)
+    matrices[:, 1, 2] = 2.0 * (y * z + x * w)
+    matrices[:, 2, 0] = 2.0 * (z * x + y * w)
+    matrices[:, 2, 1] = 2.0 * (y * z - x * w)
+    matrices[:, 2, 2] = 1.0 - 2.0 * (y * y + x * x)
+    matrices[:, 0:3, 0:3] *= scales[:, :, numpy.newaxis]
+    matrices[:, 3, 0:3] = translations
+    matrices[:, 3, 3] = 1
+
+    for nodeIdx in matrixNodes:
+        matrices[nodeIdx] = numpy.array(gltfNodes[nodeIdx]['matrix'], numpy.float64).reshape(4, 4)
+    return matrices
+
+
+class glTFNodeTable:
+    # node hierarchy in arrays: parent per node, children in CSR layout, local and world transforms
+    def __init__(self, gltfNodes):
+        count = len(gltfNodes)
+        self.ids = [str(nodeIdx) for nodeIdx in range(count)] # node ids for usdUtils.NodeManager
+        childrenCounts = numpy.zeros(count, numpy.int64)
+        children = []
+        for nodeIdx, gltfNode in enumerate(gltfNodes):
+            if 'children' in gltfNode:
+                childrenCounts[nodeIdx] = len(gltfNode['children'])
+                children.extend(gltfNode['children'])
+        self.childrenOffsets = numpy.concatenate(([0], numpy.cumsum(childrenCounts)))
+        self.children = numpy.array(children, numpy.int64)
+        self.parents = numpy.full(count, -1, numpy.int64)
+        self.parents[self.children] = numpy.repeat(numpy.arange(count), childrenCounts)
+        self.roots = numpy.flatnonzero(self.parents == -1)
+        self.localMatrices = getLocalMatrices(gltfNodes)
+        self._worldMatrices = None # use self.getWorldMatrices()
+
+
+    def getChildren(self, nodeIdx):
+        return self.children[self.childrenOffsets[nodeIdx]:self.childrenOffsets[nodeIdx + 1]]
+
+
+    def getWorldMatrices(self):
+        if self._worldMatrices is None:
+            # one batched multiplication per hierarchy level, from roots to leaves
+            worldMatrices = numpy.tile(numpy.identity(4), (len(self.parents), 1, 1))
+            level = self.roots
+            worldMatrices[level] = self.localMatrices[level]
+            for depth in range(len(self.parents)): # guard against cycles
+                starts = self.childrenOffsets[level]
+                counts = self.childrenOffsets[level + 1] - starts
+                total = numpy.sum(counts)
+                if total == 0:
+                    break
+                level = self.children[numpy.repeat(starts - (numpy.cumsum(counts) - counts), counts) + numpy.arange(total)]
+                worldMatrices[level] = numpy.matmul(self.localMatrices[level], worldMatrices[self.parents[level]])
+            self._worldMatrices = worldMatrices
+        return self._worldMatrices
+
+
+def getTransformComponent(gltfNode, targetPath):
+    # rest translation, rotation or scale of a node
+    if targetPath in gltfNode:
+        return gltfNode[targetPath]
+    # TODO: support decomposition?
+    return [0, 0, 0, 1] if targetPath == 'rotation' else [1, 1, 1] if targetPath == 'scale' else [0, 0, 0]
+
+
+skeletonTargetPaths = ['translation', 'rotation', 'scale']
+
+
+class AnimationCurve:
+    # key time codes sorted in ascending order and key values as (keys, components) array
+    def __init__(self, times, values):
+        order = numpy.argsort(times, kind='stable')
+        times = times[order]
+        values = values[order]
+        # a later key with the same time code overrides an earlier one
+        isLast = numpy.append(times[1:] != times[:-1], True)
+        self.times = times[isLast]
+        self.values = values[isLast]
+
+
+def slerpQuaternions(k, q0, q1):
+    # batched Gf.Slerp for (x, y, z, w) quaternions
+    cosTheta = numpy.sum(q0 * q1, axis=-1)
+    sign = numpy.where(cosTheta < 0, -1.0, 1.0)
+    cosTheta = numpy.minimum(numpy.abs(cosTheta), 1.0)
+    theta = numpy.arccos(cosTheta)
+    sinTheta = numpy.sin(theta)
+    isFar = 1.0 - cosTheta > 0.00001
+    sinTheta = numpy.where(isFar, sinTheta, 1.0)
+    scale0 = numpy.where(isFar, numpy.sin((1.0 - k) * theta) / sinTheta, 1.0 - k)
+    scale1 = numpy.where(isFar, numpy.sin(k * theta) / sinTheta, k) * sign
+    return scale0[..., numpy.newaxis] * q0 + scale1[..., numpy.newaxis] * q1
+
+
+def sampleAnimationCurves(curves, sampleTimes, isSlerp=False):
+    # values of all curves at all sample times as (times, curves, components) array
+    # keys of all curves are searched at once: each curve is shifted to its own time range
+    keyTimes = numpy.concatenate([curve.times for curve in curves])
+    keyValues = numpy.concatenate([curve.values for curve in curves]).astype(numpy.float64)
+    minTime = min(keyTimes.min(), sampleTimes.min())
+    stride = max(keyTimes.max(), sampleTimes.max()) - minTime + 1
+    keyCounts = numpy.array([len(curve.times) for curve in curves])
+    ends = numpy.cumsum(keyCounts)
+    starts = ends - keyCounts
+    shifts = numpy.arange(len(curves)) * stride - minTime
+    shiftedKeyTimes = keyTimes + numpy.repeat(shifts, keyCounts)
+    shiftedSampleTimes = sampleTimes[:, numpy.newaxis] + shifts[numpy.newaxis, :]
+
+    lower = numpy.searchsorted(shiftedKeyTimes, shiftedSampleTimes, 'right') - 1
+    lower = numpy.clip(lower, starts, ends - 1)
+    upper = numpy.minimum(lower + 1, ends - 1)
+    timeRange = keyTimes[upper] - keyTimes[lower]
+    k = (sampleTimes[:, numpy.newaxis] - keyTimes[lower]) / numpy.where(timeRange > 0, timeRange, 1)
+    k = numpy.where(timeRange > 0, numpy.clip(k, 0.0, 1.0), 0.0)
+
+    v0 = keyValues[lower]
+    v1 = keyValues[upper]
     if isSlerp:
-        q = Gf.Slerp(k, timeValueDic[lessMaxTime], timeValueDic[greaterMinTime])
-        i = q.GetImaginary()
-        return Gf.Quatf(q.GetReal(), Gf.Vec3f(i[0], i[1], i[2]))
-
-    return timeValueDic[lessMaxTime] * (1-k) + timeValueDic[greaterMinTime] * k
+        values = slerpQuaternions(k, v0, v1)
+    else:
+        values = v0 * (1 - k[..., numpy.newaxis]) + v1 * k[..., numpy.newaxis]
+    # keep exact key values
+    return numpy.where((k == 0)[..., numpy.newaxis], v0, values)
 
 
 def getXformOp(usdGeom, type):
@@ -225,50 +322,62 @@ def getXformOp(usdGeom, type):
 
 
 def indicesWithTriangleStrip(indices):
-    if len(indices) <= 3:
-        return indices
-    newIndices = [int(indices[0]), int(indices[1]), int(indices[2])]
-    for i in range(3, len(indices)):
-        newIndices.append(int(indices[i-1]))
-        newIndices.append(int(indices[i-2]))
-        newIndices.append(int(indices[i]))
-    return newIndices
+    # triangle i is (i, i+1, i+2) for even i and (i, i+2, i+1) for odd i, to keep the winding
+    first = numpy.arange(max(len(indices) - 2, 0))
+    odd = first % 2
+    triangles = numpy.stack((first, first + 1 + odd, first + 2 - odd), axis=1)
+    return numpy.asarray(indices, numpy.int32)[triangles.reshape(-1)]
 
 
 def indicesWithTriangleFan(indices):
-    if len(indices) <= 3:
-        return indices
-    newIndices = []
-    for i in range(2, len(indices)):
-        newIndices.append(int(indices[0]))
-        newIndices.append(int(indices[i-1]))
-        newIndices.append(int(indices[i]))
-    return newIndices
-
-
-def deindexPoints(points, indices):
-    newPoints = []
-    for  i in range(len(indices)):
-        newPoints.append(Gf.Vec3f(
-            float(points[indices[i]*3]), 
-            float(points[indices[i]*3 + 1]),
-            float(points[indices[i]*3 + 2])))
-    return newPoints
-
-
-def getGfVec3fFromData(data, offset, elementCount):
-    return Gf.Vec3f(float(data[offset]), float(data[offset + 1]), float(data[offset + 2]))
-
-
-def getGfQuatfFromData(data, offset, elementCount):
-    return Gf.Quatf(float(data[offset + 3]), Gf.Vec3f(float(data[offset]), float(data[offset + 1]), float(data[offset + 2])))
-
-
-def getFloatArrayFromData(data, offset, elementCount):
-    elements = []
-    for i in range(elementCount):
-        elements.append(float(data[offset + i]))
-    return Vt.FloatArray(elements)
+    second = numpy.arange(1, max(len(indices) - 1, 1))
+    triangles = numpy.stack((numpy.zeros_like(second), second, second + 1), axis=1)
+    return numpy.asarray(indices, numpy.int32)[triangles.reshape(-1)]
+
+
+def getTriangleIndices(mode, indices, count):
+    # face vertex indices for triangles, triangle strips and triangle fans
+    if indices is None:
+        if mode == gltfPrimitiveMode.TRIANGLES:
+            count = int(count / 3) * 3 # should be divisible by 3
+        indices = numpy.arange(count, dtype=numpy.int32)
+    if mode == gltfPrimitiveMode.TRIANGLE_STRIP:
+        return indicesWithTriangleStrip(indices)
+    if mode == gltfPrimitiveMode.TRIANGLE_FAN:
+        return indicesWithTriangleFan(indices)
+    return indices
+
+
+def getVertexData(accessor, deindexIndices=None, asFloat=True):
+    # per-vertex elements as (count, components) array, gathered by indices for primitives without indices in USD
+    data = accessor.getFloatData() if asFloat else accessor.data
+    data = data.reshape(accessor.count, accessor.components)
+    if deindexIndices is not None:
+        data = data[deindexIndices]
+    return data
+
+
+def padVertexData(data, count):
+    # morph target attributes can be shorter than the other ones
+    if len(data) >= count:
+        return data
+    return numpy.concatenate((data, numpy.zeros((count - len(data), data.shape[1]), data.dtype)))
+
+
+def setTimeSamples(attr, times, values):
+    # author all time samples of an attribute directly in the edit target layer, with one change notification
+    # values are (times, elements, components) array for array attributes and (times, components) for others
+    typeName = attr.GetTypeName()
+    if typeName.isArray:
+        vtArrayType = typeName.type.pythonClass
+        samples = [vtArrayType.FromNumpy(value) for value in values]
+    else:
+        samples = typeName.arrayType.type.pythonClass.FromNumpy(values)
+    layer = attr.GetStage().GetEditTarget().GetLayer()
+    path = attr.GetPath()
+    with Sdf.ChangeBlock():
+        for time, sample in zip(times, samples):
+            layer.SetTimeSample(path, float(time), sample)
 
 
 def convertUVTransformForUSD(translation, scale, rotation):
@@ -328,24 +437,15 @@ class glTFNodeManager(usdUtils.NodeManager):
 
 
     def overrideGetChildren(self, strNodeIdx):
-        children = []
-        if strNodeIdx is None:
-            for i in range(len(self.converter.gltf['nodes'])):
-                if self.overrideGetParent(str(i)) is None:
-                    children.append(str(i))
-            return children
-        gltfNode = self.converter.gltf['nodes'][int(strNodeIdx)]
-        if 'children' in gltfNode:
-            for child in gltfNode['children']:
-                children.append(str(child))
-        return children
+        nodeTable = self.converter.nodeTable
+        nodeIndices = nodeTable.roots if strNodeIdx is None else nodeTable.getChildren(int(strNodeIdx))
+        return [nodeTable.ids[nodeIdx] for nodeIdx in nodeIndices]
 
 
     def overrideGetLocalTransformGfMatrix4d(self, strNodeIdx):
         if strNodeIdx is None:
             return Gf.Matrix4d(1)
-        gltfNode = self.converter.gltf['nodes'][int(strNodeIdx)]
-        return getMatrixTransform(gltfNode)
+        return Gf.Matrix4d(self.converter.nodeTable.localMatrices[int(strNodeIdx)])
 
 
     def overrideGetWorldTransformGfMatrix4d(self, strNodeIdx):
@@ -358,40 +458,155 @@ class glTFNodeManager(usdUtils.NodeManager):
         parentIdx = self.converter.getParent(int(node))
         if parentIdx == -1:
             return None
-        return str(parentIdx)
+        return self.converter.nodeTable.ids[parentIdx]
+
+
+
+def readComponents(content, offset, componentType, count, components, stride=0):
+    fmt = glTFComponentType(componentType).unpackFormat()
+    componentSize = glTFComponentType(componentType).size()
+    if stride != 0 and stride != componentSize * components:
+        # interleaved data: strided view over the buffer, gathered with one copy
+        strided = numpy.ndarray((count, components), fmt, content, offset, (stride, componentSize))
+        return strided.reshape(count * components)
+    return numpy.frombuffer(content, fmt, count * components, offset)
 
 
 
 class Accessor:
     def __init__(self, gltfData, accessorIdx):
         gltfAccessor = gltfData.gltf['accessors'][accessorIdx]
-        accessorByteOffset = getInt(gltfAccessor, 'byteOffset')
         self.componentType = int(gltfAccessor['componentType'])
-        fmt = glTFComponentType(self.componentType).unpackFormat()
-
-        bufferViewIdx = gltfAccessor['bufferView']
-        bufferView = gltfData.gltf['bufferViews'][bufferViewIdx]
-        byteLength = bufferView['byteLength']
-        byteOffset = getInt(bufferView, 'byteOffset')
-        bufferIdx = bufferView['buffer']
-
-        fileContent = gltfData.buffers[bufferIdx]
-        offset = accessorByteOffset + byteOffset
-
         self.count = gltfAccessor['count']
         self.type = gltfAccessor['type']
         self.components = numOfComponents(self.type)
-
-        self.stride = getInt(bufferView, 'byteStride')
-        if self.stride != 0 and self.stride != glTFComponentType(self.componentType).size() * self.components:
-            elementsSize = glTFComponentType(self.componentType).size() * self.components
-            data = b''
-            for i in range(self.count):
-                start = offset + i * self.stride
-                data += fileContent[start : start + elementsSize]
-            self.data = numpy.frombuffer(data, fmt, self.count * self.components)
+        self.stride = 0
+        self.normalized = gltfAccessor['normalized'] if 'normalized' in gltfAccessor else False
+        self.sparseIndices = None # sparse accessor without bufferView: all other elements are zeros
+
+        if 'bufferView' in gltfAccessor:
+            bufferViewIdx = gltfAccessor['bufferView']
+            bufferView = gltfData.gltf['bufferViews'][bufferViewIdx]
+            self.stride = getInt(bufferView, 'byteStride')
+            self.data = readComponents(gltfData.getBufferView(bufferViewIdx), getInt(gltfAccessor, 'byteOffset'), 
+                self.componentType, self.count, self.components, self.stride)
         else:
-            self.data = numpy.frombuffer(fileContent, fmt, self.count * self.components, offset)
+            fmt = glTFComponentType(self.componentType).unpackFormat()
+            self.data = numpy.zeros(self.count * self.components, fmt)
+
+        if 'sparse' in gltfAccessor:
+            self._applySparse(gltfData, gltfAccessor['sparse'], 'bufferView' not in gltfAccessor)
+
+        if self.normalized and self.componentType != glTFComponentType.FLOAT:
+            # dequantization, KHR_mesh_quantization
+            scale = glTFComponentType(self.componentType).normalizationScale()
+            self.data = numpy.maximum(self.data.astype(numpy.float32) / scale, -1.0)
+
+
+    def getFloatData(self):
+        # integer vertex attributes without normalization are allowed by KHR_mesh_quantization
+        if self.data.dtype == numpy.float32:
+            return self.data
+        return self.data.astype(numpy.float32)
+
+
+    # private:
+    def _applySparse(self, gltfData, gltfSparse, hasNoBase):
+        sparseCount = gltfSparse['count']
+        gltfIndices = gltfSparse['indices']
+        gltfValues = gltfSparse['values']
+        indices = readComponents(gltfData.getBufferView(gltfIndices['bufferView']), getInt(gltfIndices, 'byteOffset'), 
+            int(gltfIndices['componentType']), sparseCount, 1)
+        values = readComponents(gltfData.getBufferView(gltfValues['bufferView']), getInt(gltfValues, 'byteOffset'), 
+            self.componentType, sparseCount, self.components)
+
+        if not self.data.flags.writeable:
+            self.data = self.data.copy()
+        self.data.reshape(self.count, self.components)[indices] = values.reshape(sparseCount, self.components)
+        if hasNoBase:
+            self.sparseIndices = indices
+
+
+
+def collectTextureIndices(gltfObject, textures):
+    # texture infos are the objects with 'index' under keys like baseColorTexture or normalTexture
+    for key, value in gltfObject.items():
+        if isinstance(value, dict):
+            if key[-7:] == 'Texture' and 'index' in value:
+                textures.add(value['index'])
+            collectTextureIndices(value, textures)
+
+
+class glTFSceneContent:
+    # indices of glTF objects used by one scene
+    def __init__(self, gltf, sceneNodes):
+        self.nodes = set()
+        self.meshes = set()
+        self.skins = set()
+        self.materials = set()
+        self.textures = set()
+        self.animations = set()
+        self.accessors = set()
+        self.bufferViews = set()
+        self.buffers = set()
+
+        gltfNodes = gltf['nodes'] if 'nodes' in gltf else []
+        nodesToVisit = list(sceneNodes)
+        while len(nodesToVisit):
+            nodeIdx = nodesToVisit.pop()
+            if nodeIdx in self.nodes:
+                continue
+            self.nodes.add(nodeIdx)
+            gltfNode = gltfNodes[nodeIdx]
+            if 'mesh' in gltfNode:
+                self.meshes.add(gltfNode['mesh'])
+            if 'skin' in gltfNode:
+                self.skins.add(gltfNode['skin'])
+            if 'extensions' in gltfNode and 'EXT_mesh_gpu_instancing' in gltfNode['extensions']:
+                self.accessors.update(gltfNode['extensions']['EXT_mesh_gpu_instancing']['attributes'].values())
+            if 'children' in gltfNode:
+                nodesToVisit.extend(gltfNode['children'])
+
+        for meshIdx in self.meshes:
+            for gltfPrimitive in gltf['meshes'][meshIdx]['primitives']:
+                self.accessors.update(gltfPrimitive['attributes'].values())
+                if 'indices' in gltfPrimitive:
+                    self.accessors.add(gltfPrimitive['indices'])
+                for target in gltfPrimitive['targets'] if 'targets' in gltfPrimitive else []:
+                    self.accessors.update(target.values())
+                if 'material' in gltfPrimitive:
+                    self.materials.add(gltfPrimitive['material'])
+
+        for skinIdx in self.skins:
+            gltfSkin = gltf['skins'][skinIdx]
+            if 'inverseBindMatrices' in gltfSkin:
+                self.accessors.add(gltfSkin['inverseBindMatrices'])
+
+        for animIdx, gltfAnim in enumerate(gltf['animations'] if 'animations' in gltf else []):
+            if any('node' in gltfChannel['target'] and gltfChannel['target']['node'] in self.nodes for gltfChannel in gltfAnim['channels']):
+                self.animations.add(animIdx)
+                for gltfSampler in gltfAnim['samplers']:
+                    self.accessors.add(gltfSampler['input'])
+                    self.accessors.add(gltfSampler['output'])
+
+        for materialIdx in self.materials:
+            collectTextureIndices(gltf['materials'][materialIdx], self.textures)
+        for textureIdx in self.textures:
+            gltfTexture = gltf['textures'][textureIdx]
+            if 'source' in gltfTexture:
+                image = gltf['images'][gltfTexture['source']]
+                if 'bufferView' in image:
+                    self.bufferViews.add(image['bufferView'])
+
+        for accessorIdx in self.accessors:
+            gltfAccessor = gltf['accessors'][accessorIdx]
+            if 'bufferView' in gltfAccessor:
+                self.bufferViews.add(gltfAccessor['bufferView'])
+            if 'sparse' in gltfAccessor:
+                self.bufferViews.add(gltfAccessor['sparse']['indices']['bufferView'])
+                self.bufferViews.add(gltfAccessor['sparse']['values']['bufferView'])
+        for bufferViewIdx in self.bufferViews:
+            self.buffers.add(gltf['bufferViews'][bufferViewIdx]['buffer'])
 
 
 
@@ -406,11 +621,20 @@ class glTFConverter:
         self.nodeNames = {} # to avoid duplicate node names
         self.copyTextures = openParameters.copyTextures
         self.verbose = openParameters.verbose
+        self.blendShapeEpsilon = openParameters.blendShapeEpsilon # smaller offsets are dropped from blend shapes
+        self.mergePrimitives = openParameters.mergePrimitives # one mesh with material subsets for all primitives of a mesh
         self.legacyModifier = legacyModifier # for iOS 12 compatibility
         self.skeletonByNode = {} # collect skinned mesh to construct later 
         self.blendShapeByNode = {} # collect meshes with blend shapes to construct later 
-        self._worldTransforms = {} # use self.getWorldTransform(nodeIdx)
-        self._parents = {} # use self.getParent(nodeIdx)
+        self._mappedFiles = [] # keep memory-mapped buffers alive while accessors reference them
+        self._accessors = OrderedDict() # use self.getAccessor(accessorIdx)
+        self._accessorsBytes = 0
+        self._accessorCacheHits = 0
+        self._accessorCacheMisses = 0
+        self._jointRemapTables = {} # use self.getJointRemapTable(skinIdx)
+        self._dataUris = {} # use self.getDataUri(uri)
+        self._meshPrototypes = {} # meshes shared by several nodes, use self.getMeshPrototype(nodeIdx, meshIdx)
+        self.textureWriter = None # embedded textures and copies are written in background during conversion
         self._loadFailed = False
         openParameters.metersPerUnit = 1
 
@@ -430,6 +654,15 @@ class glTFConverter:
             return
         if not self.checkGLTFVersion():
             return
+        self.nodeTable = glTFNodeTable(self.gltf['nodes'] if 'nodes' in self.gltf else [])
+
+        self.sceneIdx = self.findScene(openParameters.scene)
+        if self.sceneIdx == -1:
+            usdUtils.printError("can't find scene: " + openParameters.scene)
+            self._loadFailed = True
+            return
+        # buffers, materials, skins and animations which are not used by the scene are skipped
+        self.sceneContent = glTFSceneContent(self.gltf, self.getSceneNodes())
         self.readAllBuffers()
 
         self.nodeManager = glTFNodeManager(self)
@@ -445,12 +678,84 @@ class glTFConverter:
                 (jsonLen, jsonType) = loadChunk(file, '<2i')
                 self.gltf = json.loads(file.read(jsonLen))
                 (bufferLen, bufferType) = loadChunk(file, '<2i')
-                self.buffers.append(file.read())
+                self.buffers.append(self.mapBuffer(gltfPath, file.tell(), bufferLen))
         else:
             with open(gltfPath) as file:
                 self.gltf = json.load(file)
 
 
+    def mapBuffer(self, path, offset=0, length=-1):
+        # buffer content is paged in by the OS only when accessors touch it
+        with open(path, 'rb') as file:
+            fileSize = os.fstat(file.fileno()).st_size
+            if length < 0:
+                length = fileSize - offset
+            if length <= 0:
+                return memoryview(b'')
+            mappedFile = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._mappedFiles.append(mappedFile)
+        return memoryview(mappedFile)[offset:(offset + length)]
+
+
+    def getDataUri(self, uri):
+        # buffers and images can share embedded data, decode it once
+        if uri not in self._dataUris:
+            self._dataUris[uri] = parseDataUri(uri)
+        return self._dataUris[uri]
+
+
+    def getBufferView(self, bufferViewIdx):
+        # zero-copy view of the bufferView content
+        bufferView = self.gltf['bufferViews'][bufferViewIdx]
+        byteLength = bufferView['byteLength']
+        byteOffset = getInt(bufferView, 'byteOffset')
+        buffer = memoryview(self.buffers[bufferView['buffer']])
+        return buffer[byteOffset:(byteOffset + byteLength)]
+
+
+    def getAccessor(self, accessorIdx):
+        # accessors are shared by primitives and animation samplers, decode each of them once
+        accessor = self._accessors.get(accessorIdx)
+        if accessor is not None:
+            self._accessors.move_to_end(accessorIdx)
+            self._accessorCacheHits += 1
+            return accessor
+        self._accessorCacheMisses += 1
+        accessor = Accessor(self, accessorIdx)
+        self._accessors[accessorIdx] = accessor
+        self._accessorsBytes += accessor.data.nbytes
+        while self._accessorsBytes > ACCESSOR_CACHE_MAX_BYTES and len(self._accessors) > 1:
+            (evictedIdx, evicted) = self._accessors.popitem(last=False)
+            self._accessorsBytes -= evicted.data.nbytes
+        return accessor
+
+
+    def findScene(self, scene):
+        # scene index or name, default scene if scene is None
+        gltfScenes = self.gltf['scenes'] if 'scenes' in self.gltf else []
+        if scene is None:
+            return self.gltf['scene'] if 'scene' in self.gltf else 0
+        if scene.isdigit() and int(scene) < len(gltfScenes):
+            return int(scene)
+        for sceneIdx in range(len(gltfScenes)):
+            if 'name' in gltfScenes[sceneIdx] and gltfScenes[sceneIdx]['name'] == scene:
+                return sceneIdx
+        return -1
+
+
+    def getSceneNodes(self):
+        if 'scenes' not in self.gltf or self.sceneIdx >= len(self.gltf['scenes']):
+            # no scenes: all root nodes
+            return [int(nodeIdx) for nodeIdx in self.nodeTable.roots]
+        gltfScene = self.gltf['scenes'][self.sceneIdx]
+        return gltfScene['nodes'] if 'nodes' in gltfScene else []
+
+
+    def getSceneAnimations(self):
+        gltfAnimations = self.gltf['animations'] if 'animations' in self.gltf else []
+        return [gltfAnimations[animIdx] for animIdx in sorted(self.sceneContent.animations)]
+
+
     def checkGLTFVersion(self):
         if 'asset' in self.gltf and 'version' in self.gltf['asset']:
             version = self.gltf['asset']['version']
@@ -463,37 +768,16 @@ class glTFConverter:
         return not self._loadFailed
 
 
-    def _fillWorldTransforms(self, children, parentWorldTransform):
-        for nodeIdx in children:
-            gltfNode = self.gltf['nodes'][nodeIdx]
-            worldTransform =  getMatrixTransform(gltfNode) * parentWorldTransform
-            self._worldTransforms[str(nodeIdx)] = worldTransform
-            if 'children' in gltfNode:
-                self._fillWorldTransforms(gltfNode['children'], worldTransform)
-
-
     def getWorldTransform(self, nodeIdx):
         if nodeIdx == -1:
             return Gf.Matrix4d(1)
-        if not self._worldTransforms:
-            self._fillWorldTransforms(self.gltf['scenes'][0]['nodes'], Gf.Matrix4d(1))
-        return self._worldTransforms[str(nodeIdx)]
-
-
-    def _fillParents(self, children, parentId):
-        for nodeIdx in children:
-            gltfNode = self.gltf['nodes'][nodeIdx]
-            self._parents[str(nodeIdx)] = parentId
-            if 'children' in gltfNode:
-                self._fillParents(gltfNode['children'], nodeIdx)
+        return Gf.Matrix4d(self.nodeTable.getWorldMatrices()[nodeIdx])
 
 
     def getParent(self, nodeIdx):
         if nodeIdx == -1:
             return -1
-        if not self._parents:
-            self._fillParents(self.gltf['scenes'][0]['nodes'], -1)
-        return self._parents[str(nodeIdx)]
+        return int(self.nodeTable.parents[nodeIdx])
 
 
     def saveTexture(self, content, mimeType, textureIdx):
@@ -504,21 +788,12 @@ class glTFConverter:
         if mimeType == 'image/jpeg':
             ext = '.jpg'
         filename = 'textures/texgen_' + str(textureIdx) + ext
-        
-        newfile = open(self.dstFolder + filename, 'wb')
-        newfile.write(content)
+        self.textureWriter.write(self.dstFolder + filename, content)
         return filename
 
 
     def saveTextureWithImage(self, image, textureIdx):
-        bufferViewIdx = image['bufferView']
-        bufferView = self.gltf['bufferViews'][bufferViewIdx]
-        byteLength = bufferView['byteLength']
-        byteOffset = getInt(bufferView, 'byteOffset')
-        bufferIdx = bufferView['buffer']
-
-        buffer = self.buffers[bufferIdx]
-        content = numpy.frombuffer(buffer, numpy.uint8, byteLength, byteOffset)
+        content = self.getBufferView(image['bufferView'])
         return self.saveTexture(content, image['mimeType'], textureIdx)
 
 
@@ -537,15 +812,11 @@ class glTFConverter:
         textureFilename = '' # valid for USD
         if 'uri' in image:
             uri = image['uri']
-            if len(uri) > 5 and uri[:5] == 'data:':
+            if isDataUri(uri):
                 # embedded texture
-                for offset in range(5, len(uri) - 6):
-                    if uri[offset:(offset+6)] == 'base64':
-                        mimeType = uri[5:(offset-1)] if offset > 6 else ''
-                        content = base64.b64decode(uri[(offset + 6):])
-                        textureFilename = self.saveTexture(content, mimeType, textureIdx)
-                        srcTextureFilename = self.dstFolder + textureFilename
-                        break
+                (mimeType, content) = self.getDataUri(uri)
+                textureFilename = self.saveTexture(content, mimeType, textureIdx)
+                srcTextureFilename = self.dstFolder + textureFilename
             else:
                 srcTextureFilename = uri
                 textureFilename = usdUtils.makeValidPath(srcTextureFilename)
@@ -553,10 +824,10 @@ class glTFConverter:
                 ext = filenameAndExt[1].lower()
                 if '.jpeg' == ext:
                     textureFilename = filenameAndExt[0] + '.jpg'
-                    usdUtils.copy(self.srcFolder + srcTextureFilename, self.dstFolder + textureFilename, self.verbose)
+                    self.textureWriter.copy(self.srcFolder + srcTextureFilename, self.dstFolder + textureFilename)
                 elif self.srcFolder != self.dstFolder:
                     if self.copyTextures or srcTextureFilename != textureFilename:
-                        usdUtils.copy(self.srcFolder + srcTextureFilename, self.dstFolder + textureFilename, self.verbose)
+                        self.textureWriter.copy(self.srcFolder + srcTextureFilename, self.dstFolder + textureFilename)
                     else:
                         textureFilename = self.srcFolder + textureFilename
                 srcTextureFilename = self.srcFolder + srcTextureFilename
@@ -569,6 +840,7 @@ class glTFConverter:
             return False
 
         if self.legacyModifier is not None and (channels == 'g' or channels == 'b' or channels == 'r'):
+            self.textureWriter.wait(srcTextureFilename)
             newTextureFilename = self.legacyModifier.makeOneChannelTexture(srcTextureFilename, self.dstFolder, channels, self.verbose)
             if newTextureFilename:
                 textureFilename = newTextureFilename
@@ -605,20 +877,19 @@ class glTFConverter:
 
 
     def readAllBuffers(self):
-        for buffer in self.gltf['buffers']:
+        for bufferIdx, buffer in enumerate(self.gltf['buffers'] if 'buffers' in self.gltf else []):
+            if bufferIdx not in self.sceneContent.buffers:
+                if bufferIdx >= len(self.buffers):
+                    self.buffers.append(None)
+                continue
             if 'uri' in buffer:
                 uri = buffer['uri']
-                if len(uri) > 5 and uri[:5] == 'data:':
-                    for offset in range(5, len(uri) - 6):
-                        if uri[offset:(offset+6)] == 'base64':
-                            fileContent = base64.b64decode(uri[(offset + 6):])
-                            self.buffers.append(fileContent)
-                            break
+                if isDataUri(uri):
+                    (mimeType, fileContent) = self.getDataUri(uri)
+                    self.buffers.append(fileContent)
                 else:
                     bufferFileName = self.srcFolder + uri
-                    with open(bufferFileName, mode='rb') as file:
-                        fileContent = file.read()
-                    self.buffers.append(fileContent)
+                    self.buffers.append(self.mapBuffer(bufferFileName))
 
 
     def textureHasAlpha(self, filename):
@@ -631,6 +902,9 @@ class glTFConverter:
 
     def createMaterials(self):
         for gltfMaterial in self.gltf['materials'] if 'materials' in self.gltf else []:
+            if len(self.usdMaterials) not in self.sceneContent.materials:
+                self.usdMaterials.append(None)
+                continue
             matName = getName(gltfMaterial, 'material_', len(self.usdMaterials))
             material = usdUtils.Material(matName)
 
@@ -721,6 +995,9 @@ class glTFConverter:
             return
 
         for skinIdx in range(len(self.gltf['skins'])):
+            if skinIdx not in self.sceneContent.skins:
+                self.skinning.skins.append(usdUtils.Skin()) # keep skin indices, skins without joints are skipped
+                continue
             gltfSkin = self.gltf['skins'][skinIdx]
 
             root = str(gltfSkin['skeleton']) if 'skeleton' in gltfSkin else None
@@ -733,7 +1010,7 @@ class glTFConverter:
 
             # get bind matrices
             if 'inverseBindMatrices' in gltfSkin:
-                bindMatAcc = Accessor(self, gltfSkin['inverseBindMatrices'])
+                bindMatAcc = self.getAccessor(gltfSkin['inverseBindMatrices'])
                 m = bindMatAcc.data
                 i = 0
                 for jointIdx in gltfJoints:
@@ -758,6 +1035,14 @@ class glTFConverter:
                 skeleton.makeUsdSkeleton(self.usdStage, self.asset.getGeomPath() + '/RootNodeSkel', self.nodeManager)
 
 
+    def getJointRemapTable(self, skinIdx):
+        # maps glTF joint indices of the skin to joint indices of its skeleton
+        if skinIdx not in self._jointRemapTables:
+            skin = self.skinning.skins[skinIdx]
+            self._jointRemapTables[skinIdx] = numpy.array(skin.getSkeletonIndices(), numpy.int32)
+        return self._jointRemapTables[skinIdx]
+
+
     def _prepareBlendShape(self, nodeIdx):
         gltfNode = self.gltf['nodes'][nodeIdx]
         if 'mesh' in gltfNode:
@@ -781,7 +1066,7 @@ class glTFConverter:
 
 
     def prepareBlendShapes(self):
-        for childNodeIdx in self.gltf['scenes'][0]['nodes']:
+        for childNodeIdx in self.getSceneNodes():
             self._prepareBlendShape(childNodeIdx)
 
 
@@ -811,85 +1096,75 @@ class glTFConverter:
 
 
     def prepareAnimations(self):
-        if 'animations' not in self.gltf:
+        if len(self.sceneContent.animations) == 0:
             return
         # find good FPS based on key time data
         minTimeInterval = 1.0 / 24 # default for USD
         epsilon = 0.01
-        for gltfAnim in self.gltf['animations']:
+        for gltfAnim in self.getSceneAnimations():
             for gltfChannel in gltfAnim['channels']:
                 samplerIdx = gltfChannel['sampler']
                 gltfSampler = gltfAnim['samplers'][samplerIdx]
-                keyTimesAcc = Accessor(self, gltfSampler['input'])
-                for el in range(keyTimesAcc.count-1):
-                    timeInterval = keyTimesAcc.data[el+1] - keyTimesAcc.data[el]
-                    if minTimeInterval > timeInterval and timeInterval > epsilon:
-                        minTimeInterval = timeInterval
+                keyTimesAcc = self.getAccessor(gltfSampler['input'])
+                timeIntervals = numpy.diff(keyTimesAcc.data)
+                timeIntervals = timeIntervals[timeIntervals > epsilon]
+                if len(timeIntervals):
+                    minTimeInterval = min(minTimeInterval, timeIntervals.min())
         self.asset.setFPS(int(1.0 / minTimeInterval))
 
 
-    def getInterpolatedValues(self, interpolation, keyTimesAcc, keyValuesAcc, getValueFromData, timeSet=None, elementCount=1):
-        values = {}
-        data = keyValuesAcc.data
+    def toTimeCodes(self, keyTimes):
+        # self.asset.toTimeCode(time, True) for an array of key times
+        keyTimes = numpy.asarray(keyTimes, numpy.float64)
+        if len(keyTimes):
+            self.asset.extentTime(keyTimes.min())
+            self.asset.extentTime(keyTimes.max())
+        real = keyTimes * self.asset.timeCodesPerSecond
+        rounded = numpy.floor(real + 0.5)
+        epsilon = 0.001
+        return numpy.where(numpy.abs(real - rounded) < epsilon, rounded, real)
+
+
+    def getInterpolatedValues(self, interpolation, keyTimesAcc, keyValuesAcc, elementCount=1, isRotation=False):
         valueElementCount = keyValuesAcc.components * elementCount
+        data = keyValuesAcc.getFloatData().reshape(-1, valueElementCount)
+        keyTimes = self.toTimeCodes(keyTimesAcc.data)
         if interpolation == 'CUBICSPLINE':
-            for el in range(keyTimesAcc.count - 1):
-                t0 = self.asset.toTimeCode(keyTimesAcc.data[el], True)
-                t1 = self.asset.toTimeCode(keyTimesAcc.data[el + 1], True)
-
-                smallTimeRange = 0.00001
-                timeRange = t1 - t0
-                if timeRange < smallTimeRange: timeRange = smallTimeRange
-                timeSteps = int(timeRange)
-                if timeSteps == 0: timeSteps = 1
-
-                # math is described in glTF specification
-                offset = el * valueElementCount * 3 + valueElementCount
-                p0 = getValueFromData(data, offset, elementCount)
-                offset = el * valueElementCount * 3 + valueElementCount * 2
-                m0 = getValueFromData(data, offset, elementCount) * timeRange
-                offset = (el + 1) * valueElementCount * 3
-                m1 = getValueFromData(data, offset, elementCount) * timeRange
-                offset = (el + 1) * valueElementCount * 3 + valueElementCount
-                p1 = getValueFromData(data, offset, elementCount)
-
-                for timeStep in range(timeSteps):
-                    t = float(timeStep) / timeSteps
-                    t2 = t * t
-                    t3 = t2 * t
-                    p = (2*t3 - 3*t2 + 1) * p0 + (t3 - 2*t2 + t) * m0 + (-2*t3 + 3*t2) * p1 + (t3 - t2) * m1
-                    if type(p) is Gf.Quatf:
-                        p = p.GetNormalized()
-                    values[t0 + timeStep] = p
-                    if timeSet is not None:
-                        timeSet.add(t0 + timeStep)
-
-            el = keyTimesAcc.count - 1
-            time = self.asset.toTimeCode(keyTimesAcc.data[el], True)
-            offset = el * valueElementCount * 3 + valueElementCount
-            values[time] = getValueFromData(data, offset, elementCount)
-            if timeSet is not None:
-                timeSet.add(time)
-        else:
-            if interpolation == 'STEP':
-                for el in range(1, keyTimesAcc.count):
-                    time = self.asset.toTimeCode(keyTimesAcc.data[el], True) - 1
-                    offset = (el - 1) * valueElementCount
-                    values[time] = getValueFromData(data, offset, elementCount)
-                    if timeSet is not None:
-                        timeSet.add(time)
-            for el in range(keyTimesAcc.count):
-                time = self.asset.toTimeCode(keyTimesAcc.data[el], True)
-                offset = el * valueElementCount
-                values[time] = getValueFromData(data, offset, elementCount)
-                if timeSet is not None:
-                    timeSet.add(time)
-
-        return values
+            # math is described in glTF specification, evaluated for all segments at once
+            inTangents = data[0::3]
+            points = data[1::3]
+            outTangents = data[2::3]
+
+            smallTimeRange = 0.00001
+            timeRanges = numpy.maximum(numpy.diff(keyTimes), smallTimeRange)
+            timeSteps = numpy.maximum(timeRanges.astype(int), 1)
+
+            # one sample per time code step of each segment
+            segments = numpy.repeat(numpy.arange(len(timeSteps)), timeSteps)
+            steps = numpy.arange(len(segments)) - numpy.repeat(numpy.cumsum(timeSteps) - timeSteps, timeSteps)
+            t = (steps / timeSteps[segments])[:, numpy.newaxis]
+            t2 = t * t
+            t3 = t2 * t
+            timeRange = timeRanges[segments][:, numpy.newaxis]
+            p0 = points[segments]
+            m0 = outTangents[segments] * timeRange
+            m1 = inTangents[segments + 1] * timeRange
+            p1 = points[segments + 1]
+            p = (2*t3 - 3*t2 + 1) * p0 + (t3 - 2*t2 + t) * m0 + (-2*t3 + 3*t2) * p1 + (t3 - t2) * m1
+            if isRotation:
+                p = p / numpy.linalg.norm(p, axis=1, keepdims=True)
+
+            times = numpy.append(keyTimes[segments] + steps, keyTimes[-1:])
+            return AnimationCurve(times, numpy.concatenate((p, points[-1:])))
+
+        if interpolation == 'STEP':
+            # hold previous value until one time code before the next key
+            return AnimationCurve(numpy.concatenate((keyTimes[1:] - 1, keyTimes)), numpy.concatenate((data[:-1], data)))
+        return AnimationCurve(keyTimes, data)
 
 
     def processSkeletonAnimation(self):
-        for gltfAnim in self.gltf['animations'] if 'animations' in self.gltf else []:
+        for gltfAnim in self.getSceneAnimations():
 
             skeleton = self.findSkeletonForAnimation(gltfAnim)
             if skeleton is None:
@@ -897,16 +1172,11 @@ class glTFConverter:
 
             name = getName(gltfAnim, 'skelAnim_', len(self.usdSkelAnims))
 
-            # animJoints is a matrix of all animated values with time keys
             # animJoints is a dictionary with joint ids as keys
             # each element of animJoints has a three elements list: [0] -- translations, [1] -- rotations, [2] -- scales
-            # each of it has a dictionary with time keys {0: value, 1: next value... }
+            # each of it is an AnimationCurve or None
             animJoints = {}
 
-            translationTimeSet = set()
-            rotationTimeSet = set()
-            scaleTimeSet = set()
-
             # Fill animJoints
             for gltfChannel in gltfAnim['channels']:
                 gltfTarget = gltfChannel['target']
@@ -923,31 +1193,20 @@ class glTFConverter:
                 gltfSampler = gltfAnim['samplers'][samplerIdx]
                 interpolation = gltfSampler['interpolation'] if 'interpolation' in gltfSampler else 'LINEAR'
 
-                keyTimesAcc = Accessor(self, gltfSampler['input'])
-                keyValuesAcc = Accessor(self, gltfSampler['output'])
+                keyTimesAcc = self.getAccessor(gltfSampler['input'])
+                keyValuesAcc = self.getAccessor(gltfSampler['output'])
 
                 if strNodeIdx not in animJoints:
                     animJoints[strNodeIdx] = [None] * 3
 
-                pathIdx = -1
-                timeSet = None
-                if targetPath == 'translation':
-                    pathIdx = 0
-                    timeSet = translationTimeSet
-                elif targetPath == 'rotation':
-                    pathIdx = 1
-                    timeSet = rotationTimeSet
-                elif targetPath == 'scale':
-                    pathIdx = 2
-                    timeSet = scaleTimeSet
-                else:
+                if targetPath not in skeletonTargetPaths:
                     if self.verbose:
                         usdUtils.printWarning("Skeletal animation: unsupported target path: " + targetPath)
                     continue
 
-                getValueFromData = getGfQuatfFromData if targetPath == 'rotation' else getGfVec3fFromData
-                values = self.getInterpolatedValues(interpolation, keyTimesAcc, keyValuesAcc, getValueFromData, timeSet)
-                animJoints[strNodeIdx][pathIdx] = values
+                pathIdx = skeletonTargetPaths.index(targetPath)
+                curve = self.getInterpolatedValues(interpolation, keyTimesAcc, keyValuesAcc, 1, targetPath == 'rotation')
+                animJoints[strNodeIdx][pathIdx] = curve
 
             if len(animJoints) == 0:
                 continue
@@ -963,76 +1222,34 @@ class glTFConverter:
             usdSkelAnim.CreateJointsAttr(jointPaths)
 
             gltfNodes = self.gltf['nodes']
+            animatedJoints = [joint for joint in skeleton.joints if joint in animJoints]
+            attrs = [usdSkelAnim.CreateTranslationsAttr(), usdSkelAnim.CreateRotationsAttr(), usdSkelAnim.CreateScalesAttr()]
+
+            for pathIdx, targetPath in enumerate(skeletonTargetPaths):
+                attr = attrs[pathIdx]
+                curves = [animJoints[joint][pathIdx] for joint in animatedJoints if animJoints[joint][pathIdx] is not None]
+                if len(curves) == 0: # add default values if no keys
+                    restValue = getTransformComponent({}, targetPath)
+                    vtArrayType = attr.GetTypeName().type.pythonClass
+                    attr.Set(vtArrayType.FromNumpy(numpy.tile(numpy.array(restValue, numpy.float32), (len(animatedJoints), 1))))
+                    continue
 
-            # translations attribute
-            times = sorted(translationTimeSet)
-            attr = usdSkelAnim.CreateTranslationsAttr()
-            for time in times:
-                values = []
-                for joint in skeleton.joints:
-                    if joint in animJoints:
-                        animJoint = animJoints[joint]
-                        if animJoint[0]:
-                            values.append(getInterpolatedValue(animJoint[0], time))
-                        else:
-                            values.append(getTransformTranslation(gltfNodes[int(joint)]))
-                if len(values):
-                    attr.Set(values, Usd.TimeCode(time))
-            if len(times) == 0: # add default values if no keys
-                values = []
-                for joint in skeleton.joints:
-                    if joint in animJoints:
-                        values.append(Gf.Vec3f(0, 0, 0))
-                attr.Set(values)
-
-            # rotations attribute
-            times = sorted(rotationTimeSet)
-            attr = usdSkelAnim.CreateRotationsAttr()
-            for time in times:
-                values = []
-                for joint in skeleton.joints:
-                    if joint in animJoints:
-                        animJoint = animJoints[joint]
-                        if animJoint[1]:
-                            values.append(getInterpolatedValue(animJoint[1], time, True))
-                        else:
-                            values.append(getTransformRotation(gltfNodes[int(joint)]))
-                if len(values):
-                    attr.Set(values, Usd.TimeCode(time))
-            if len(times) == 0:
-                values = []
-                for joint in skeleton.joints:
-                    if joint in animJoints:
-                        values.append(Gf.Quatf(1, Gf.Vec3f(0, 0, 0)))
-                attr.Set(values)
-
-            # scales attribute
-            times = sorted(scaleTimeSet)
-            attr = usdSkelAnim.CreateScalesAttr()
-            for time in times:
-                values = []
-                for joint in skeleton.joints:
-                    if joint in animJoints:
-                        animJoint = animJoints[joint]
-                        if animJoint[2]:
-                            values.append(getInterpolatedValue(animJoint[2], time))
-                        else:
-                            values.append(getTransformScale(gltfNodes[int(joint)]))
-                if len(values):
-                    attr.Set(values, Usd.TimeCode(time))
-            if len(times) == 0:
-                values = []
-                for joint in skeleton.joints:
-                    if joint in animJoints:
-                        values.append(Gf.Vec3f(1, 1, 1))
-                attr.Set(values)
+                # sample all animated joints at all key times of this path at once
+                times = numpy.unique(numpy.concatenate([curve.times for curve in curves]))
+                values = numpy.empty((len(times), len(animatedJoints), len(curves[0].values[0])), numpy.float32)
+                animatedIndices = [i for i, joint in enumerate(animatedJoints) if animJoints[joint][pathIdx] is not None]
+                values[:, animatedIndices] = sampleAnimationCurves(curves, times, targetPath == 'rotation')
+                for i, joint in enumerate(animatedJoints):
+                    if animJoints[joint][pathIdx] is None:
+                        values[:, i] = getTransformComponent(gltfNodes[int(joint)], targetPath)
+                setTimeSamples(attr, times, values)
 
             skeleton.setSkeletalAnimation(usdSkelAnim)
             self.usdSkelAnims.append(usdSkelAnim)
 
 
     def processBlendShapeAnimations(self):
-        for gltfAnim in self.gltf['animations'] if 'animations' in self.gltf else []:
+        for gltfAnim in self.getSceneAnimations():
 
             blendShape = self.findBlendShapeForAnimation(gltfAnim)
             if blendShape is None:
@@ -1052,19 +1269,83 @@ class glTFConverter:
                 samplerIdx = gltfChannel['sampler']
                 gltfSampler = gltfAnim['samplers'][samplerIdx]
                 interpolation = gltfSampler['interpolation'] if 'interpolation' in gltfSampler else 'LINEAR'
-                keyTimesAcc = Accessor(self, gltfSampler['input'])
-                keyValuesAcc = Accessor(self, gltfSampler['output'])
+                keyTimesAcc = self.getAccessor(gltfSampler['input'])
+                keyValuesAcc = self.getAccessor(gltfSampler['output'])
 
                 if targetPath == 'weights':
-                    values = self.getInterpolatedValues(interpolation, keyTimesAcc, keyValuesAcc, getFloatArrayFromData, None, blendShape.weightsCount)
-                    for time, value in values.items():
-                        attr.Set(time = time, value = value)
+                    curve = self.getInterpolatedValues(interpolation, keyTimesAcc, keyValuesAcc, blendShape.weightsCount)
+                    setTimeSamples(attr, curve.times, curve.values)
 
             blendShape.setSkeletalAnimation(usdSkelAnim)
             self.usdSkelAnims.append(usdSkelAnim)
 
 
 
+    def bindSkinning(self, nodeIdx, usdGeom, skinIdx, skeleton):
+        usdSkelBinding = None
+        skin = None
+        if skinIdx != -1:
+            skin = self.skinning.skins[skinIdx]
+            if skin.skeleton is not None:
+                usdSkelBinding = UsdSkel.BindingAPI(usdGeom)
+                differenceTransform = Gf.Matrix4d(1)
+                usdSkelBinding.CreateGeomBindTransformAttr(differenceTransform)
+                if skin.skeleton.usdSkeleton is not None:
+                    usdSkelBinding.CreateSkeletonRel().AddTarget(skin.skeleton.usdSkeleton.GetPath())
+                    if self.legacyModifier is not None:
+                        self.legacyModifier.addSkelAnimToMesh(usdGeom, skin.skeleton)
+        elif skeleton is not None:
+            meshNodeWorldMatrix = self.getWorldTransform(nodeIdx)
+            skeleton.bindRigidDeformation(str(nodeIdx), usdGeom, meshNodeWorldMatrix)
+            if self.legacyModifier is not None:
+                self.legacyModifier.addSkelAnimToMesh(usdGeom, skeleton)
+        return usdSkelBinding
+
+
+    def getPrimitiveAttributeData(self, key, accessor, deindexIndices, skinIdx):
+        # vertex attribute data as (count, components) array ready for USD, None for unsupported attributes
+        if key == 'POSITION' or key == 'NORMAL' or key == 'WEIGHTS_0':
+            return getVertexData(accessor, deindexIndices)
+        elif key[0:8] == 'TEXCOORD':
+            data = getVertexData(accessor, deindexIndices)
+            # Y-component of texture coordinates should be flipped
+            newData = numpy.empty((len(data), 2), numpy.float32)
+            newData[:, 0] = data[:, 0]
+            newData[:, 1] = 1.0 - data[:, 1]
+            return newData
+        elif key == 'COLOR_0':
+            data = getVertexData(accessor, deindexIndices)
+            # displayColor for USD should have Color3Array type
+            return numpy.ascontiguousarray(data[:, 0:3])
+        elif key == 'JOINTS_0':
+            return self.getJointRemapTable(skinIdx)[getVertexData(accessor, deindexIndices, False)]
+        return None
+
+
+    def setPrimitiveAttribute(self, usdGeom, usdSkelBinding, key, data):
+        if key == 'POSITION':
+            usdGeom.CreatePointsAttr(Vt.Vec3fArray.FromNumpy(data))
+        elif key == 'NORMAL':
+            normalPrimvar = usdGeom.CreatePrimvar('normals', Sdf.ValueTypeNames.Normal3fArray, UsdGeom.Tokens.vertex)
+            normalPrimvar.Set(Vt.Vec3fArray.FromNumpy(data))
+        elif key[0:8] == 'TEXCOORD':
+            texCoordSet = key[9:]
+            primvarName = 'st' if texCoordSet == '0' else 'st' + texCoordSet
+            uvs = usdGeom.CreatePrimvar(primvarName, Sdf.ValueTypeNames.TexCoord2fArray, UsdGeom.Tokens.vertex)
+            uvs.Set(Vt.Vec2fArray.FromNumpy(data))
+        elif key == 'COLOR_0':
+            usdGeom.CreateDisplayColorPrimvar(UsdGeom.Tokens.vertex).Set(Vt.Vec3fArray.FromNumpy(data))
+        elif key =='JOINTS_0':
+            elementSize = data.shape[1]
+            usdSkelBinding.CreateJointIndicesPrimvar(False, elementSize).Set(Vt.IntArray.FromNumpy(data.reshape(-1)))
+        elif key =='WEIGHTS_0':
+            # Normalize weights
+            elementSize = data.shape[1]
+            newData = Vt.FloatArray.FromNumpy(data.reshape(-1))
+            UsdSkel.NormalizeWeights(newData, elementSize)
+            usdSkelBinding.CreateJointWeightsPrimvar(False, elementSize).Set(newData)
+
+
     def processPrimitive(self, nodeIdx, gltfPrimitive, path, skinIdx, skeleton):
         if 'extensions' in gltfPrimitive:
             extensions = gltfPrimitive['extensions']
@@ -1077,7 +1358,7 @@ class glTFConverter:
         count = 0 # points count (deindiced)
         indices = None
         if 'indices' in gltfPrimitive:
-            accessor = Accessor(self, gltfPrimitive['indices'])
+            accessor = self.getAccessor(gltfPrimitive['indices'])
             count = accessor.count
             indices = accessor.data
 
@@ -1107,109 +1388,32 @@ class glTFConverter:
         if usdGeom is None:
             usdGeom = UsdGeom.Mesh.Define(self.usdStage, path)
 
-        usdSkelBinding = None
-        skin = None
-        if skinIdx != -1:
-            skin = self.skinning.skins[skinIdx]
-            if skin.skeleton is not None:
-                usdSkelBinding = UsdSkel.BindingAPI(usdGeom)
-                differenceTransform = Gf.Matrix4d(1)
-                usdSkelBinding.CreateGeomBindTransformAttr(differenceTransform)
-                if skin.skeleton.usdSkeleton is not None:
-                    usdSkelBinding.CreateSkeletonRel().AddTarget(skin.skeleton.usdSkeleton.GetPath())
-                    if self.legacyModifier is not None:
-                        self.legacyModifier.addSkelAnimToMesh(usdGeom, skin.skeleton)
-        elif skeleton is not None:
-            meshNodeWorldMatrix = self.getWorldTransform(nodeIdx)
-            skeleton.bindRigidDeformation(str(nodeIdx), usdGeom, meshNodeWorldMatrix)
-            if self.legacyModifier is not None:
-                self.legacyModifier.addSkelAnimToMesh(usdGeom, skeleton)
+        usdSkelBinding = self.bindSkinning(nodeIdx, usdGeom, skinIdx, skeleton)
 
         attributes = gltfPrimitive['attributes']
+        deindexIndices = indices if toDeindexPoints else None
 
         for key in attributes:
-            accessor = Accessor(self, attributes[key])
-
-            if key == 'POSITION':
-                if toDeindexPoints:
-                    points = deindexPoints(accessor.data, indices)
-                    usdGeom.CreatePointsAttr(points)
-                else:
-                    usdGeom.CreatePointsAttr(accessor.data)
-                    if count == 0: # no indices
-                        count = accessor.count
-            elif key == 'NORMAL':
-                normalPrimvar = usdGeom.CreatePrimvar('normals', Sdf.ValueTypeNames.Normal3fArray, UsdGeom.Tokens.vertex)
-                normalPrimvar.Set(accessor.data)
-            elif key == 'TANGENT':
-                pass
-            elif key[0:8] == 'TEXCOORD':
-                if accessor.componentType != glTFComponentType.FLOAT:
-                    if self.verbose:
-                        print('Warnig: component type ' + accessor.componentType + ' is not supported for texture coordinates')
-                    break
-                # Y-component of texture coordinates should be flipped
-                newData = []
-                for el in range(accessor.count):
-                    newData.append((
-                        float(accessor.data[el * accessor.components]),
-                        float(1.0 - accessor.data[el * accessor.components + 1])))
-
-                texCoordSet = key[9:]
-                primvarName = 'st' if texCoordSet == '0' else 'st' + texCoordSet
-                uvs = usdGeom.CreatePrimvar(primvarName, Sdf.ValueTypeNames.TexCoord2fArray, UsdGeom.Tokens.vertex)
-                uvs.Set(newData)
-            elif key == 'COLOR_0':
-                data = accessor.data
-                if accessor.type == 'VEC4':
-                    # displayColor for USD should have Color3Array type
-                    newData = []
-                    for el in range(accessor.count):
-                        newData.append((
-                            float(data[el * accessor.components]),
-                            float(data[el * accessor.components + 1]),
-                            float(data[el * accessor.components + 2])))
-                    data = newData
-                usdGeom.CreateDisplayColorPrimvar(UsdGeom.Tokens.vertex).Set(data)
-            elif key =='JOINTS_0':
-                if usdSkelBinding != None:
-                    newData = [0] * accessor.count * accessor.components
-                    for i in range(accessor.count * accessor.components):
-                        newData[i] = skin.remapIndex(accessor.data[i])
-                    usdSkelBinding.CreateJointIndicesPrimvar(False, accessor.components).Set(newData)
-            elif key =='WEIGHTS_0':
-                if usdSkelBinding != None:
-                    # Normalize weights
-                    newData = Vt.FloatArray(list(map(float, accessor.data)))
-                    UsdSkel.NormalizeWeights(newData, accessor.components)
-                    usdSkelBinding.CreateJointWeightsPrimvar(False, accessor.components).Set(newData)
-            else:
+            accessor = self.getAccessor(attributes[key])
+            if key == 'POSITION' and count == 0: # no indices
+                count = accessor.count
+            if key == 'TANGENT':
+                continue
+            if (key == 'JOINTS_0' or key == 'WEIGHTS_0') and usdSkelBinding is None:
+                continue
+            data = self.getPrimitiveAttributeData(key, accessor, deindexIndices, skinIdx)
+            if data is None:
                 usdUtils.printWarning("Unsupported primitive attribute: " + key)
+                continue
+            self.setPrimitiveAttribute(usdGeom, usdSkelBinding, key, data)
 
         if (mode == gltfPrimitiveMode.TRIANGLES or 
             mode == gltfPrimitiveMode.TRIANGLE_STRIP or 
             mode == gltfPrimitiveMode.TRIANGLE_FAN):
-            if indices is not None:
-                if mode == gltfPrimitiveMode.TRIANGLE_STRIP:
-                    indices = indicesWithTriangleStrip(indices)
-                    count = len(indices)
-                elif mode == gltfPrimitiveMode.TRIANGLE_FAN:
-                    indices = indicesWithTriangleFan(indices)
-                    count = len(indices)
-                usdGeom.CreateFaceVertexIndicesAttr(indices)
-            elif count > 0:
-                if mode == gltfPrimitiveMode.TRIANGLES:
-                    count = int(count / 3) * 3 # should be divisible by 3
-                indices = [0] * count
-                for ind in range(count):
-                    indices[ind] = ind 
-                if mode == gltfPrimitiveMode.TRIANGLE_STRIP:
-                    indices = indicesWithTriangleStrip(indices)
-                    count = len(indices)
-                elif mode == gltfPrimitiveMode.TRIANGLE_FAN:
-                    indices = indicesWithTriangleFan(indices)
-                    count = len(indices)
-                usdGeom.CreateFaceVertexIndicesAttr(indices)
+            if indices is not None or count > 0:
+                indices = getTriangleIndices(mode, indices, count)
+                count = len(indices)
+                usdGeom.CreateFaceVertexIndicesAttr(Vt.IntArray.FromNumpy(indices))
             numFaceVertexCounts = int(count / 3)
             faceVertexCounts = [3] * numFaceVertexCounts
             usdGeom.CreateFaceVertexCountsAttr(faceVertexCounts) # per-face vertex indices
@@ -1246,47 +1450,45 @@ class glTFConverter:
                 usdBlendShape = UsdSkel.BlendShape.Define(self.usdStage, blendShapeTarget)
 
                 positions = None
-                positionsLen = 0
                 normals = None
-                normalsLen = 0
+                sparseIndices = []
+                isSparse = True
                 for key in target:
                     if key == 'POSITION':
-                        accessor = Accessor(self, target[key])
-                        positions = accessor.data
-                        positionsLen = int(len(positions) / 3)
+                        accessor = self.getAccessor(target[key])
+                        positions = getVertexData(accessor)
                     elif key == 'NORMAL':
-                        accessor = Accessor(self, target[key])
-                        normals = accessor.data
-                        normalsLen = int(len(normals) / 3)
-
-                offsets = []
-                normalOffsets = []
-                pointIndices = []
-                pointsCount = max(positionsLen, normalsLen)
-
-                for idx in range(pointsCount):
-                    if ((positionsLen and (positions[idx*3] != 0 or positions[idx*3 + 1] != 0 or positions[idx*3 + 2] != 0)) or
-                        (normalsLen and (normals[idx*3] != 0 or normals[idx*3 + 1] != 0 or normals[idx*3 + 2] != 0))):
-
-                        if positionsLen:
-                            offsets.append(Gf.Vec3f(
-                                float(positions[idx*3]), 
-                                float(positions[idx*3 + 1]), 
-                                float(positions[idx*3 + 2])))
-
-                        if normalsLen:
-                            normalOffsets.append(Gf.Vec3f(
-                                float(normals[idx*3]), 
-                                float(normals[idx*3 + 1]), 
-                                float(normals[idx*3 + 2])))
-
-                        pointIndices.append(idx)
-
-                if positionsLen:
-                    usdBlendShape.CreateOffsetsAttr(offsets)
-                if normalsLen:
-                    usdBlendShape.CreateNormalOffsetsAttr(normalOffsets)
-                usdBlendShape.CreatePointIndicesAttr(pointIndices)
+                        accessor = self.getAccessor(target[key])
+                        normals = getVertexData(accessor)
+                    else:
+                        continue
+                    if accessor.sparseIndices is None:
+                        isSparse = False
+                    else:
+                        sparseIndices.append(accessor.sparseIndices)
+
+                pointsCount = max(len(positions) if positions is not None else 0, len(normals) if normals is not None else 0)
+
+                # sparse targets can have non-zero offsets at sparse indices only
+                if isSparse and len(sparseIndices) > 0:
+                    candidateIndices = numpy.unique(numpy.concatenate(sparseIndices))
+                else:
+                    candidateIndices = numpy.arange(pointsCount)
+
+                # keep points with position or normal offsets greater than epsilon
+                isOffset = numpy.zeros(len(candidateIndices), bool)
+                if positions is not None:
+                    positions = padVertexData(positions, pointsCount)[candidateIndices]
+                    isOffset |= (numpy.abs(positions) > self.blendShapeEpsilon).any(axis=1)
+                if normals is not None:
+                    normals = padVertexData(normals, pointsCount)[candidateIndices]
+                    isOffset |= (numpy.abs(normals) > self.blendShapeEpsilon).any(axis=1)
+
+                if positions is not None:
+                    usdBlendShape.CreateOffsetsAttr(Vt.Vec3fArray.FromNumpy(positions[isOffset]))
+                if normals is not None:
+                    usdBlendShape.CreateNormalOffsetsAttr(Vt.Vec3fArray.FromNumpy(normals[isOffset]))
+                usdBlendShape.CreatePointIndicesAttr(Vt.IntArray.FromNumpy(candidateIndices[isOffset].astype(numpy.int32)))
 
             usdSkelBlendShapeBinding = UsdSkel.BindingAPI(usdGeom)
             usdSkelBlendShapeBinding.CreateBlendShapesAttr(blendShapes)
@@ -1302,7 +1504,196 @@ class glTFConverter:
         return usdGeom
 
 
-    #TODO: Support instansing
+    def isDoubleSided(self, gltfPrimitive):
+        if 'material' not in gltfPrimitive:
+            return False
+        gltfMaterial = self.gltf['materials'][gltfPrimitive['material']]
+        return 'doubleSided' in gltfMaterial and gltfMaterial['doubleSided'] == True
+
+
+    def canMergePrimitives(self, gltfPrimitives):
+        # triangle primitives with the same attributes, without morph targets and extensions
+        triangleModes = [gltfPrimitiveMode.TRIANGLES, gltfPrimitiveMode.TRIANGLE_STRIP, gltfPrimitiveMode.TRIANGLE_FAN]
+        keys = sorted(gltfPrimitives[0]['attributes'].keys())
+        doubleSided = self.isDoubleSided(gltfPrimitives[0])
+        for gltfPrimitive in gltfPrimitives:
+            mode = gltfPrimitive['mode'] if 'mode' in gltfPrimitive else gltfPrimitiveMode.TRIANGLES
+            if mode not in triangleModes or 'targets' in gltfPrimitive or 'extensions' in gltfPrimitive:
+                return False
+            if sorted(gltfPrimitive['attributes'].keys()) != keys or 'POSITION' not in keys:
+                return False
+            if self.isDoubleSided(gltfPrimitive) != doubleSided:
+                return False
+        return True
+
+
+    def processMergedPrimitives(self, nodeIdx, gltfPrimitives, path, skinIdx, skeleton):
+        # one mesh for all primitives, materials are bound to subsets of faces
+        usdGeom = UsdGeom.Mesh.Define(self.usdStage, path)
+        usdSkelBinding = self.bindSkinning(nodeIdx, usdGeom, skinIdx, skeleton)
+
+        attributeData = {}
+        primitiveIndices = []
+        pointsOffset = 0
+        for gltfPrimitive in gltfPrimitives:
+            mode = gltfPrimitive['mode'] if 'mode' in gltfPrimitive else gltfPrimitiveMode.TRIANGLES
+            attributes = gltfPrimitive['attributes']
+            for key in attributes:
+                if key == 'TANGENT':
+                    continue
+                if (key == 'JOINTS_0' or key == 'WEIGHTS_0') and usdSkelBinding is None:
+                    continue
+                data = self.getPrimitiveAttributeData(key, self.getAccessor(attributes[key]), None, skinIdx)
+                if data is None:
+                    usdUtils.printWarning("Unsupported primitive attribute: " + key)
+                    continue
+                if key not in attributeData:
+                    attributeData[key] = []
+                attributeData[key].append(data)
+
+            pointsCount = self.getAccessor(attributes['POSITION']).count
+            indices = self.getAccessor(gltfPrimitive['indices']).data if 'indices' in gltfPrimitive else None
+            indices = getTriangleIndices(mode, indices, pointsCount)
+            primitiveIndices.append(indices.astype(numpy.int32) + pointsOffset)
+            pointsOffset += pointsCount
+
+        for key, data in attributeData.items():
+            self.setPrimitiveAttribute(usdGeom, usdSkelBinding, key, numpy.concatenate(data))
+
+        indices = numpy.concatenate(primitiveIndices)
+        usdGeom.CreateFaceVertexIndicesAttr(Vt.IntArray.FromNumpy(indices))
+        usdGeom.CreateFaceVertexCountsAttr([3] * int(len(indices) / 3)) # per-face vertex indices
+        usdGeom.CreateSubdivisionSchemeAttr(UsdGeom.Tokens.none)
+        if self.isDoubleSided(gltfPrimitives[0]):
+            usdGeom.CreateDoubleSidedAttr(True)
+
+        # bind materials to subsets of faces
+        facesCounts = numpy.array([int(len(indices) / 3) for indices in primitiveIndices])
+        facesStarts = numpy.cumsum(facesCounts) - facesCounts
+        materialIndices = [gltfPrimitive['material'] if 'material' in gltfPrimitive else -1 for gltfPrimitive in gltfPrimitives]
+        if len(set(materialIndices)) == 1:
+            if materialIndices[0] != -1:
+                UsdShade.MaterialBindingAPI(usdGeom.GetPrim()).Bind(self.usdMaterials[materialIndices[0]])
+            return usdGeom
+
+        bindingAPI = UsdShade.MaterialBindingAPI(usdGeom.GetPrim())
+        for materialIdx in sorted(set(materialIndices)):
+            if materialIdx == -1:
+                continue
+            faces = numpy.concatenate([numpy.arange(facesStarts[i], facesStarts[i] + facesCounts[i], dtype=numpy.int32)
+                for i in range(len(gltfPrimitives)) if materialIndices[i] == materialIdx])
+            usdMaterial = self.usdMaterials[materialIdx]
+            subsetName = usdMaterial.GetPath().name + 'Subset'
+            if self.verbose:
+                print('    subset: ' + subsetName + ' faces: ' + str(len(faces)))
+            usdSubset = UsdShade.MaterialBindingAPI.CreateMaterialBindSubset(bindingAPI, subsetName, Vt.IntArray.FromNumpy(faces))
+            UsdShade.MaterialBindingAPI(usdSubset).Bind(usdMaterial)
+        return usdGeom
+
+
+    def prepareInstancing(self):
+        # nodes without skinning share the mesh data
+        meshUsers = {}
+        for nodeIdx in self.sceneContent.nodes:
+            gltfNode = self.gltf['nodes'][nodeIdx]
+            if 'mesh' in gltfNode and 'skin' not in gltfNode:
+                meshIdx = gltfNode['mesh']
+                meshUsers[meshIdx] = meshUsers[meshIdx] + 1 if meshIdx in meshUsers else 1
+
+        for meshIdx, count in meshUsers.items():
+            gltfPrimitives = self.gltf['meshes'][meshIdx]['primitives']
+            hasTargets = any('targets' in gltfPrimitive for gltfPrimitive in gltfPrimitives)
+            # blend shapes are bound to each mesh separately
+            if count > 1 and not hasTargets:
+                self._meshPrototypes[meshIdx] = ''
+
+
+    def getMeshPrototype(self, nodeIdx, meshIdx):
+        prototypePath = self._meshPrototypes[meshIdx]
+        if not prototypePath:
+            gltfMesh = self.gltf['meshes'][meshIdx]
+            prototypePath = self.asset.getPrototypesPath() + '/' + getName(gltfMesh, 'mesh_', meshIdx)
+            if self.usdStage.GetPrimAtPath(prototypePath).IsValid():
+                prototypePath = prototypePath + '_' + str(meshIdx)
+            self._meshPrototypes[meshIdx] = prototypePath
+            self.processMeshPrimitives(nodeIdx, gltfMesh, prototypePath, -1, None)
+        return prototypePath
+
+
+    def reserveNodeName(self, name):
+        # prims added next to child nodes take their names first, so child nodes are renamed instead of colliding
+        uniqueName = name
+        suffix = 1
+        while uniqueName in self.nodeNames:
+            uniqueName = name + '_instance' + (str(suffix) if suffix > 1 else '')
+            suffix += 1
+        self.nodeNames[uniqueName] = uniqueName
+        return uniqueName
+
+
+    def processMeshInstance(self, nodeIdx, path):
+        gltfNode = self.gltf['nodes'][nodeIdx]
+        prototypePath = self.getMeshPrototype(nodeIdx, gltfNode['mesh'])
+        typeName = self.usdStage.GetPrimAtPath(prototypePath).GetTypeName()
+        if 'children' in gltfNode:
+            # children of an instance are ignored, so make the instance a child of the node
+            usdGeom = UsdGeom.Xform.Define(self.usdStage, path)
+            instancePrim = self.usdStage.DefinePrim(path + '/' + self.reserveNodeName(prototypePath.split('/')[-1]), typeName)
+        else:
+            instancePrim = self.usdStage.DefinePrim(path, typeName)
+            usdGeom = UsdGeom.Xformable(instancePrim)
+        instancePrim.GetReferences().AddInternalReference(prototypePath)
+        instancePrim.SetInstanceable(True)
+        return usdGeom
+
+
+    def processGpuInstancing(self, nodeIdx, path, gltfInstancing):
+        # EXT_mesh_gpu_instancing: per-instance transforms of the node mesh
+        gltfNode = self.gltf['nodes'][nodeIdx]
+        meshIdx = gltfNode['mesh']
+        gltfMesh = self.gltf['meshes'][meshIdx]
+
+        if 'children' in gltfNode:
+            # keep child nodes out of the point instancer
+            usdGeom = UsdGeom.Xform.Define(self.usdStage, path)
+            path = path + '/' + self.reserveNodeName('instances')
+            usdInstancer = UsdGeom.PointInstancer.Define(self.usdStage, path)
+        else:
+            usdInstancer = UsdGeom.PointInstancer.Define(self.usdStage, path)
+            usdGeom = usdInstancer
+
+        self.usdStage.DefinePrim(path + '/Prototypes', 'Scope')
+        prototypePath = path + '/Prototypes/' + getName(gltfMesh, 'mesh_', meshIdx)
+        if meshIdx in self._meshPrototypes:
+            sharedPrototypePath = self.getMeshPrototype(nodeIdx, meshIdx)
+            typeName = self.usdStage.GetPrimAtPath(sharedPrototypePath).GetTypeName()
+            prototypePrim = self.usdStage.DefinePrim(prototypePath, typeName)
+            prototypePrim.GetReferences().AddInternalReference(sharedPrototypePath)
+            prototypePrim.SetInstanceable(True)
+        else:
+            self.processMeshPrimitives(nodeIdx, gltfMesh, prototypePath, -1, None)
+        usdInstancer.CreatePrototypesRel().SetTargets([prototypePath])
+
+        attributes = gltfInstancing['attributes']
+        count = 0
+        for key in ['TRANSLATION', 'ROTATION', 'SCALE']:
+            if key in attributes:
+                accessor = self.getAccessor(attributes[key])
+                count = accessor.count
+                if key == 'TRANSLATION':
+                    attr = usdInstancer.CreatePositionsAttr()
+                elif key == 'ROTATION':
+                    attr = usdInstancer.CreateOrientationsAttr()
+                else:
+                    attr = usdInstancer.CreateScalesAttr()
+                vtArrayType = attr.GetTypeName().type.pythonClass
+                attr.Set(vtArrayType.FromNumpy(getVertexData(accessor)))
+        if 'TRANSLATION' not in attributes:
+            usdInstancer.CreatePositionsAttr(Vt.Vec3fArray.FromNumpy(numpy.zeros((count, 3), numpy.float32)))
+        usdInstancer.CreateProtoIndicesAttr(Vt.IntArray.FromNumpy(numpy.zeros(count, numpy.int32)))
+        return usdGeom
+
+
     def processMesh(self, nodeIdx, path, underSkeleton):
         gltfNode = self.gltf['nodes'][nodeIdx]
         meshIdx = gltfNode['mesh']
@@ -1310,10 +1701,21 @@ class glTFConverter:
 
         skinIdx = gltfNode['skin'] if 'skin' in gltfNode else -1
 
+        if skinIdx == -1 and underSkeleton is None:
+            if 'extensions' in gltfNode and 'EXT_mesh_gpu_instancing' in gltfNode['extensions']:
+                return self.processGpuInstancing(nodeIdx, path, gltfNode['extensions']['EXT_mesh_gpu_instancing'])
+            if meshIdx in self._meshPrototypes:
+                return self.processMeshInstance(nodeIdx, path)
+        return self.processMeshPrimitives(nodeIdx, gltfMesh, path, skinIdx, underSkeleton)
+
+
+    def processMeshPrimitives(self, nodeIdx, gltfMesh, path, skinIdx, underSkeleton):
         gltfPrimitives = gltfMesh['primitives']
 
         if len(gltfPrimitives) == 1:
             usdGeom = self.processPrimitive(nodeIdx, gltfPrimitives[0], path, skinIdx, underSkeleton)
+        elif self.mergePrimitives and self.canMergePrimitives(gltfPrimitives):
+            usdGeom = self.processMergedPrimitives(nodeIdx, gltfPrimitives, path, skinIdx, underSkeleton)
         else:
             usdGeom = UsdGeom.Xform.Define(self.usdStage, path)
             for i in range(len(gltfPrimitives)):
@@ -1400,7 +1802,7 @@ class glTFConverter:
 
 
     def processNodeTransformAnimation(self):
-        for gltfAnim in self.gltf['animations'] if 'animations' in self.gltf else []:
+        for gltfAnim in self.getSceneAnimations():
             for gltfChannel in gltfAnim['channels']:
                 gltfTarget = gltfChannel['target']
                 if 'node' not in gltfTarget:
@@ -1416,9 +1818,8 @@ class glTFConverter:
                 samplerIdx = gltfChannel['sampler']
                 gltfSampler = gltfAnim['samplers'][samplerIdx]
                 interpolation = gltfSampler['interpolation'] if 'interpolation' in gltfSampler else 'LINEAR'
-                keyTimesAcc = Accessor(self, gltfSampler['input'])
-                keyValuesAcc = Accessor(self, gltfSampler['output'])
-                data = keyValuesAcc.data
+                keyTimesAcc = self.getAccessor(gltfSampler['input'])
+                keyValuesAcc = self.getAccessor(gltfSampler['output'])
 
                 if nodeIdx not in self.usdGeoms:
                     continue
@@ -1426,11 +1827,6 @@ class glTFConverter:
                 usdGeom = self.usdGeoms[nodeIdx]
 
                 xformOp = None
-                getValueFromData = getGfQuatfFromData if targetPath == 'rotation' else getGfVec3fFromData
-
-                if self.legacyModifier is not None and targetPath == 'rotation':
-                    getValueFromData = self.legacyModifier.getEulerFromData
-
                 if targetPath == 'translation':
                     xformOp = getXformOp(usdGeom, UsdGeom.XformOp.TypeTranslate)
                     if xformOp == None:
@@ -1458,9 +1854,11 @@ class glTFConverter:
                 if xformOp == None:
                     continue
 
-                values = self.getInterpolatedValues(interpolation, keyTimesAcc, keyValuesAcc, getValueFromData)
-                for time, value in values.items():
-                    xformOp.Set(time = time, value = value)
+                curve = self.getInterpolatedValues(interpolation, keyTimesAcc, keyValuesAcc, 1, targetPath == 'rotation')
+                values = curve.values
+                if self.legacyModifier is not None and targetPath == 'rotation':
+                    values = numpy.array([self.legacyModifier.eulerWithQuat(quat) for quat in Vt.QuatfArray.FromNumpy(values)])
+                setTimeSamples(xformOp.GetAttr(), curve.times, values)
 
 
     def processSkinnedMeshes(self):
@@ -1505,19 +1903,31 @@ class glTFConverter:
         if self._loadFailed:
             return None
         self.usdStage = self.asset.makeUsdStage()
-        self.createMaterials()
+        self.textureWriter = usdUtils.FileWriter(self.verbose)
+        try:
+            self.createMaterials()
+            self.convertScene()
+        finally:
+            # textures should be on disk before the stage is exported
+            self.textureWriter.join()
+        self.asset.finalize()
+        if self.verbose:
+            print('  Accessor cache: ' + str(self._accessorCacheHits) + ' hit(s), ' + str(self._accessorCacheMisses) + ' miss(es)')
+        return self.usdStage
+
+
+    def convertScene(self):
         self.prepareSkinning()
         self.prepareBlendShapes()
         self.prepareAnimations()
-        self.processNodeChildren(self.gltf['scenes'][0]['nodes'], self.asset.getGeomPath(), None)
+        self.prepareInstancing()
+        self.processNodeChildren(self.getSceneNodes(), self.asset.getGeomPath(), None)
         self.processSkeletonAnimation()
         self.processBlendShapeAnimations()
         self.processSkinnedMeshes()
         self.processBlendShapeMeshes()
         self.processNodeTransformAnimation()
         self.shapeBlending.flush()
-        self.asset.finalize()
-        return self.usdStage
 
 
 
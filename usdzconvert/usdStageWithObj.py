@@ -5,15 +5,30 @@ import sys
 import os.path
 import time
 import importlib
+import warnings
+import io
+import mmap
+import multiprocessing
+from array import array
 
 import usdUtils
 
 
+usdStageWithObjLoaded = True
+try:
+    import numpy
+except Exception as e:
+    usdUtils.printError("Failed to import numpy module. Please install numpy module for Python 3. macOS: $ sudo pip3 install numpy")
+    usdStageWithObjLoaded = False
+
 __all__ = ['usdStageWithObj']
 
 
 INVALID_INDEX = -1
 LAST_ELEMENT = -1
+RECORDS_PER_CHUNK = 65536 # consecutive v, vt, vn or f records parsed in one call
+CHUNK_MIN_BYTES = 16 * 1024 * 1024 # smaller files are parsed in one process
+CHUNKS_PER_PROCESS = 4
 
 
 def convertObjIndexToUsd(strIndex, elementsCount):
@@ -29,6 +44,13 @@ def convertObjIndexToUsd(strIndex, elementsCount):
     return INVALID_INDEX
 
 
+def convertObjIndicesToUsd(indices, elementsCount):
+    # vectorized convertObjIndexToUsd, 0 stands for missing index
+    return numpy.where(indices > 0,
+        numpy.where(indices <= elementsCount, indices - 1, INVALID_INDEX),
+        numpy.where(indices < 0, elementsCount + indices, INVALID_INDEX))
+
+
 def fixExponent(value):
     # allow for scientific notation with X.Y(+/-)eZ
     return float(value.lower().replace('+e', 'e+').replace('-e', 'e-'))
@@ -43,6 +65,187 @@ def floatList(v):
         raise
 
 
+def parseFloatRecords(records):
+    # parses records with the same number of values in one call, returns None for anything else
+    widths = set(map(len, map(str.split, records)))
+    if len(widths) != 1:
+        return None
+    width = widths.pop()
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('error') # older numpy only warns when it stops at unreadable values, like 1.0-e5
+            values = numpy.fromstring(' '.join(records), dtype=numpy.float64, sep=' ')
+    except (ValueError, DeprecationWarning):
+        return None
+    if len(values) != len(records) * width:
+        return None
+    return values.astype(numpy.float32).reshape(len(records), width)
+
+
+def parseFloatRecordRun(records):
+    # returns arrays with values of records, one array unless records differ in size
+    values = parseFloatRecords(records)
+    if values is not None:
+        return [values]
+
+    # records of different sizes or with unusual exponents
+    rows = [floatList(record.split()) for record in records]
+    if len(set(map(len, rows))) == 1:
+        return [numpy.array(rows, dtype=numpy.float32)]
+    return [numpy.array([row], dtype=numpy.float32) for row in rows]
+
+
+def parseFaceRecordsWithLayout(records):
+    # parses face records with the same v, v/vt, v//vn or v/vt/vn layout of all corners in one call, returns None for anything else
+    text = '\n'.join(records) + '\n'
+    try:
+        content = numpy.frombuffer(text.encode('ascii'), dtype=numpy.uint8)
+    except UnicodeEncodeError:
+        return None
+    allowedCharacters = numpy.zeros(256, dtype=bool)
+    allowedCharacters[numpy.frombuffer(b'0123456789-/ \n', dtype=numpy.uint8)] = True
+    if not allowedCharacters[content].all():
+        return None
+
+    isSeparator = (content == ord(' ')) | (content == ord('\n'))
+    isTokenStart = ~isSeparator & numpy.concatenate(([True], isSeparator[:-1]))
+    tokenStarts = numpy.flatnonzero(isTokenStart)
+    tokenEnds = numpy.flatnonzero(~isSeparator & numpy.concatenate((isSeparator[1:], [True])))
+    if len(tokenStarts) == 0:
+        return None
+    tokensBefore = numpy.cumsum(isTokenStart, dtype=numpy.intc) # tokens started up to each character
+    lineEnds = numpy.flatnonzero(content == ord('\n'))
+    faceVertexCounts = numpy.diff(tokensBefore[lineEnds], prepend=0)
+
+    # every corner has the same number of slashes, values are never empty except vt in v//vn
+    isSlash = content == ord('/')
+    slashCounts = numpy.bincount(tokensBefore[isSlash] - 1, minlength=len(tokenStarts))
+    slashCount = int(slashCounts[0])
+    doubleSlashCount = int(numpy.count_nonzero(isSlash[1:] & isSlash[:-1]))
+    if slashCount > 2 or (slashCounts != slashCount).any():
+        return None
+    if doubleSlashCount != 0 and not (slashCount == 2 and doubleSlashCount == len(tokenStarts)):
+        return None
+    if isSlash[tokenStarts].any() or isSlash[tokenEnds].any():
+        return None
+
+    columns = [[0], [0, 1], [0, 1, 2]][slashCount] if doubleSlashCount == 0 else [0, 2]
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            values = numpy.fromstring(text.replace('/', ' '), dtype=numpy.int64, sep=' ')
+    except (ValueError, DeprecationWarning):
+        return None
+    if len(values) != len(tokenStarts) * len(columns) or (len(values) and numpy.abs(values).max() > numpy.iinfo(numpy.intc).max):
+        return None
+
+    faceIndices = numpy.zeros((len(tokenStarts), 3), dtype=numpy.intc)
+    faceIndices[:, columns] = values.reshape(len(tokenStarts), len(columns))
+    return (array('i', faceVertexCounts.astype(numpy.intc).tobytes()), array('i', faceIndices.tobytes()))
+
+
+def parseFaceRecords(records):
+    # returns corners count of each face and OBJ v, vt and vn indices of corners, 0 for missing index
+    parsedRecords = parseFaceRecordsWithLayout(records)
+    if parsedRecords is not None:
+        return parsedRecords
+
+    faceVertexCounts = array('i')
+    faceIndices = array('i')
+    for record in records:
+        arguments = list(filter(None, record.split(' ')))
+        for argument in arguments:
+            indices = argument.split('/')[:3]
+            indices += [''] * (3 - len(indices))
+            faceIndices.extend([int(index) if index else 0 for index in indices])
+        faceVertexCounts.append(len(arguments))
+    return (faceVertexCounts, faceIndices)
+
+
+def parseRecords(command, records):
+    if 'f' == command:
+        return [(command,) + parseFaceRecords(records)]
+    return [(command, values) for values in parseFloatRecordRun(records)]
+
+
+def parseObjLines(lines):
+    # yields parsed OBJ commands in file order: runs of v, vt, vn and f records, group and material changes
+    records = [] # arguments of consecutive lines with the same command, parsed together
+    recordsCommand = ''
+    for line in lines:
+        line = line.strip()
+        if not line or '#' == line[0]:
+            continue
+
+        commandAndArguments = line.split(' ', 1)
+        command = commandAndArguments[0]
+        if command != recordsCommand or len(records) == RECORDS_PER_CHUNK:
+            if records:
+                yield from parseRecords(recordsCommand, records)
+                records = []
+            recordsCommand = ''
+
+        if 'v' == command or 'vt' == command or 'vn' == command or 'f' == command:
+            recordsCommand = command
+            records.append(commandAndArguments[1] if len(commandAndArguments) > 1 else '')
+            continue
+
+        arguments = list(filter(None, line.split(' ')))[1:]
+
+        if 'g' == command or 'o' == command:
+            yield ('g', ' '.join(arguments))
+        elif 'usemtl' == command or 'mtllib' == command:
+            yield (command, ' '.join(arguments))
+
+    if records:
+        yield from parseRecords(recordsCommand, records)
+
+
+def parseObjChunk(chunk):
+    # runs in worker process: parses part of OBJ file between byte offsets
+    (objPath, start, end) = chunk
+    with open(objPath, 'rb') as file:
+        file.seek(start)
+        content = file.read(end - start)
+    with io.TextIOWrapper(io.BytesIO(content), errors='ignore') as file:
+        return list(parseObjLines(linesContinuation(file)))
+
+
+def splitObjFile(objPath, chunkCount):
+    # returns byte ranges which start at line beginnings, continued lines are never split
+    fileSize = os.path.getsize(objPath)
+    offsets = [0]
+    if fileSize > 0:
+        with open(objPath, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            for chunkIdx in range(1, chunkCount):
+                position = max(offsets[LAST_ELEMENT], fileSize * chunkIdx // chunkCount)
+                while position < fileSize:
+                    lineEnd = content.find(b'\n', position)
+                    if lineEnd == -1:
+                        position = fileSize
+                        break
+                    lineStart = content.rfind(b'\n', 0, lineEnd) + 1
+                    position = lineEnd + 1
+                    if not content[lineStart:lineEnd].rstrip().endswith(b'\\'):
+                        break
+                if position >= fileSize:
+                    break
+                offsets.append(position)
+    offsets.append(fileSize)
+    return [(objPath, offsets[i], offsets[i + 1]) for i in range(len(offsets) - 1)]
+
+
+def intArrayToNumpy(values):
+    # zero-copy view of array('i')
+    return numpy.frombuffer(values, dtype=numpy.intc) if len(values) else numpy.zeros(0, dtype=numpy.intc)
+
+
+def compactIndices(indices):
+    # returns ascending indices of referenced elements and indices remapped to them
+    (usedIndices, remappedIndices) = numpy.unique(indices, return_inverse=True)
+    return (usedIndices, remappedIndices.reshape(-1).astype(numpy.intc))
+
+
 def linesContinuation(fileHandle):
     for line in fileHandle:
         line = line.rstrip('\n')
@@ -56,26 +259,62 @@ def linesContinuation(fileHandle):
 
 
 
+class FloatRecords:
+    # values of v, vt or vn records, kept in float32 chunks
+    def __init__(self, size):
+        self.size = size
+        self.chunks = []
+        self.count = 0
+
+
+    def __len__(self):
+        return self.count
+
+
+    def append(self, values):
+        # records with less values than size are zeros, like Gf.Vec3f()
+        if values.shape[1] >= self.size:
+            chunk = numpy.ascontiguousarray(values[:, :self.size])
+        else:
+            chunk = numpy.zeros((len(values), self.size), dtype=numpy.float32)
+        self.chunks.append(chunk)
+        self.count += len(chunk)
+
+
+    def take(self, indices):
+        # malformed negative face indices can point before the first record, they are clamped
+        return numpy.take(self.getArray(), indices, axis=0, mode='clip')
+
+
+    def getArray(self):
+        if len(self.chunks) != 1:
+            array = numpy.concatenate(self.chunks) if self.chunks else numpy.zeros((0, self.size), dtype=numpy.float32)
+            self.chunks = [array]
+        return self.chunks[0]
+
+
+
 class Subset:
     def __init__(self, materialIndex):
-        self.faces = []
+        self.faces = array('i')
         self.materialIndex = materialIndex
 
 
 class Group:
+    # indices are kept in typed arrays: 4 bytes per index instead of a Python int object
     def __init__(self, materialIndex):
         self.subsets = []
         self.currentSubset = None
 
-        self.vertexIndices = []
+        self.vertexIndices = array('i')
 
-        self.uvIndices = []
+        self.uvIndices = array('i')
         self.uvsHaveOwnIndices = False  # avoid creating indexed uv UsdAttribute if uv indices are identical to vertex indices
 
-        self.normalIndices = []
+        self.normalIndices = array('i')
         self.normalsHaveOwnIndices = False  # avoid creating indexed normal UsdAttribute if normal indices are identical to vertex indices
 
-        self.faceVertexCounts = []
+        self.faceVertexCounts = array('i')
         self.setMaterial(materialIndex)
 
 
@@ -108,14 +347,15 @@ class ObjConverter:
         self.useMtl = useMtl
         self.searchPaths = openParameters.searchPaths
         self.verbose = openParameters.verbose
+        self.processes = openParameters.objProcesses if openParameters.objProcesses > 0 else os.cpu_count()
 
         filenameFull = objPath.split('/')[-1]
         self.srcFolder = objPath[:len(objPath)-len(filenameFull)]
 
-        self.vertices = []
-        self.colors = []
-        self.uvs = []
-        self.normals = []
+        self.vertices = FloatRecords(3)
+        self.colors = FloatRecords(3)
+        self.uvs = FloatRecords(2)
+        self.normals = FloatRecords(3)
 
         self.groups = {}
         self.currentGroup = None
@@ -162,52 +402,71 @@ class ObjConverter:
             self.currentGroup.setMaterial(self.currentMaterial)
 
 
-    def addVertex(self, v):
-        v = floatList(v)
-        vLen = len(v)
-        self.vertices.append(Gf.Vec3f(v[0:3]) if vLen >= 3 else Gf.Vec3f())
-        if vLen >= 6:
-            self.colors.append(Gf.Vec3f(v[3:6]))
-
-
-    def addUV(self, v):
-        v = floatList(v)
-        self.uvs.append(Gf.Vec2f(v[0:2]) if len(v) >= 2 else Gf.Vec2f())
-
-
-    def addNormal(self, v):
-        v = floatList(v)
-        self.normals.append(Gf.Vec3f(v[0:3]) if len(v) >= 3 else Gf.Vec3f())
-
-
-    def addFace(self, arguments):
-        # arguments have format like this: ['1/1/1', '2/2/2', '3/3/3']
-        faceVertexCount = 0
-        for indexStr in arguments:
-            indices = indexStr.split('/')
-
-            vertexIndex = convertObjIndexToUsd(indices[0], len(self.vertices))
-            if vertexIndex == INVALID_INDEX:
-                break
-
-            uvIndex = INVALID_INDEX
-            if 1 < len(indices):
-                uvIndex = convertObjIndexToUsd(indices[1], len(self.uvs))
-                if uvIndex != vertexIndex:
-                    self.currentGroup.uvsHaveOwnIndices = True
-
-            normalIndex = INVALID_INDEX
-            if 2 < len(indices):
-                normalIndex = convertObjIndexToUsd(indices[2], len(self.normals))
-                if normalIndex != vertexIndex:
-                    self.currentGroup.normalsHaveOwnIndices = True
-
-            self.currentGroup.appendIndices(vertexIndex, uvIndex, normalIndex)
-            faceVertexCount += 1
-
-        if faceVertexCount > 0:
-            self.currentGroup.currentSubset.faces.append(len(self.currentGroup.faceVertexCounts))
-            self.currentGroup.faceVertexCounts.append(faceVertexCount)
+    def addRecordValues(self, command, values):
+        if 'v' == command:
+            self.vertices.append(values)
+            if values.shape[1] >= 6:
+                self.colors.append(values[:, 3:6])
+        elif 'vt' == command:
+            self.uvs.append(values)
+        elif 'vn' == command:
+            self.normals.append(values)
+
+
+    def addFaces(self, faceVertexCounts, faceIndices):
+        # faceIndices have OBJ v, vt and vn indices for each corner, 0 for missing index
+        counts = intArrayToNumpy(faceVertexCounts)
+        indices = intArrayToNumpy(faceIndices).reshape(-1, 3)
+        vertexIndices = convertObjIndicesToUsd(indices[:, 0], len(self.vertices))
+        if len(counts) == 0 or counts.min() == 0 or (vertexIndices == INVALID_INDEX).any():
+            # faces are cut at the first corner with invalid vertex index
+            self.addFacesByCorners(faceVertexCounts, faceIndices)
+            return
+
+        uvIndices = convertObjIndicesToUsd(indices[:, 1], len(self.uvs))
+        normalIndices = convertObjIndicesToUsd(indices[:, 2], len(self.normals))
+        group = self.currentGroup
+        if not group.uvsHaveOwnIndices:
+            group.uvsHaveOwnIndices = bool(((indices[:, 1] != 0) & (uvIndices != vertexIndices)).any())
+        if not group.normalsHaveOwnIndices:
+            group.normalsHaveOwnIndices = bool(((indices[:, 2] != 0) & (normalIndices != vertexIndices)).any())
+
+        group.vertexIndices.frombytes(vertexIndices.astype(numpy.intc).tobytes())
+        group.uvIndices.frombytes(uvIndices.astype(numpy.intc).tobytes())
+        group.normalIndices.frombytes(normalIndices.astype(numpy.intc).tobytes())
+        firstFace = len(group.faceVertexCounts)
+        group.currentSubset.faces.frombytes(numpy.arange(firstFace, firstFace + len(counts), dtype=numpy.intc).tobytes())
+        group.faceVertexCounts.frombytes(counts.tobytes())
+
+
+    def addFacesByCorners(self, faceVertexCounts, faceIndices):
+        cornerStart = 0
+        for cornerCount in faceVertexCounts:
+            faceVertexCount = 0
+            for corner in range(cornerStart, cornerStart + cornerCount):
+                vertexIndex = convertObjIndexToUsd(faceIndices[corner * 3], len(self.vertices))
+                if vertexIndex == INVALID_INDEX:
+                    break
+
+                uvIndex = INVALID_INDEX
+                if faceIndices[corner * 3 + 1]:
+                    uvIndex = convertObjIndexToUsd(faceIndices[corner * 3 + 1], len(self.uvs))
+                    if uvIndex != vertexIndex:
+                        self.currentGroup.uvsHaveOwnIndices = True
+
+                normalIndex = INVALID_INDEX
+                if faceIndices[corner * 3 + 2]:
+                    normalIndex = convertObjIndexToUsd(faceIndices[corner * 3 + 2], len(self.normals))
+                    if normalIndex != vertexIndex:
+                        self.currentGroup.normalsHaveOwnIndices = True
+
+                self.currentGroup.appendIndices(vertexIndex, uvIndex, normalIndex)
+                faceVertexCount += 1
+            cornerStart += cornerCount
+
+            if faceVertexCount > 0:
+                self.currentGroup.currentSubset.faces.append(len(self.currentGroup.faceVertexCounts))
+                self.currentGroup.faceVertexCounts.append(faceVertexCount)
 
 
     def checkLastSubsets(self):
@@ -236,60 +495,44 @@ class ObjConverter:
         usdMesh = UsdGeom.Mesh.Define(usdStage, geomPath + '/' + groupName)
         usdMesh.CreateSubdivisionSchemeAttr(UsdGeom.Tokens.none)
 
-        usdMesh.CreateFaceVertexCountsAttr(group.faceVertexCounts)
-
-        # vertices
-        minVertexIndex = min(group.vertexIndices)
-        maxVertexIndex = max(group.vertexIndices)
+        usdMesh.CreateFaceVertexCountsAttr(Vt.IntArray.FromNumpy(intArrayToNumpy(group.faceVertexCounts)))
 
-        groupVertices = self.vertices[minVertexIndex:maxVertexIndex+1]
-        usdMesh.CreatePointsAttr(groupVertices)
-        if minVertexIndex == 0: # optimization
-            usdMesh.CreateFaceVertexIndicesAttr(group.vertexIndices)
-        else:
-            usdMesh.CreateFaceVertexIndicesAttr(list(map(lambda x: x - minVertexIndex, group.vertexIndices)))
+        # vertices, uvs and normals are compacted to the ones referenced by the group
+        (usedVertices, vertexIndices) = compactIndices(intArrayToNumpy(group.vertexIndices))
+        groupVertices = self.vertices.take(usedVertices)
+        usdMesh.CreatePointsAttr(Vt.Vec3fArray.FromNumpy(groupVertices))
+        usdMesh.CreateFaceVertexIndicesAttr(Vt.IntArray.FromNumpy(vertexIndices))
 
-        extent = Gf.Range3f()
-        for pt in groupVertices:
-            extent.UnionWith(Gf.Vec3f(pt))
-        usdMesh.CreateExtentAttr([extent.GetMin(), extent.GetMax()])
+        usdMesh.CreateExtentAttr([Gf.Vec3f(groupVertices.min(axis=0).tolist()), Gf.Vec3f(groupVertices.max(axis=0).tolist())])
 
         # vertex colors
         if len(self.colors) == len(self.vertices):
             colorAttr = usdMesh.CreateDisplayColorPrimvar(UsdGeom.Tokens.vertex)
-            colorAttr.Set(self.colors[minVertexIndex:maxVertexIndex+1])
+            colorAttr.Set(Vt.Vec3fArray.FromNumpy(self.colors.take(usedVertices)))
 
         # texture coordinates
-        minUvIndex = min(group.uvIndices)
-        maxUvIndex = max(group.uvIndices)
-
-        if minUvIndex >= 0:
+        uvIndices = intArrayToNumpy(group.uvIndices)
+        if uvIndices.min() >= 0:
+            (usedUvs, uvIndices) = compactIndices(uvIndices)
             if group.uvsHaveOwnIndices:
                 uvPrimvar = usdMesh.CreatePrimvar('st', Sdf.ValueTypeNames.TexCoord2fArray, UsdGeom.Tokens.faceVarying)
-                uvPrimvar.Set(self.uvs[minUvIndex:maxUvIndex+1])
-                if minUvIndex == 0:  # optimization
-                    uvPrimvar.SetIndices(Vt.IntArray(group.uvIndices))
-                else:
-                    uvPrimvar.SetIndices(Vt.IntArray(list(map(lambda x: x - minUvIndex, group.uvIndices))))
+                uvPrimvar.Set(Vt.Vec2fArray.FromNumpy(self.uvs.take(usedUvs)))
+                uvPrimvar.SetIndices(Vt.IntArray.FromNumpy(uvIndices))
             else:
                 uvPrimvar = usdMesh.CreatePrimvar('st', Sdf.ValueTypeNames.TexCoord2fArray, UsdGeom.Tokens.vertex)
-                uvPrimvar.Set(self.uvs[minUvIndex:maxUvIndex+1])
+                uvPrimvar.Set(Vt.Vec2fArray.FromNumpy(self.uvs.take(usedUvs)))
 
         # normals
-        minNormalIndex = min(group.normalIndices)
-        maxNormalIndex = max(group.normalIndices)
-
-        if minNormalIndex >= 0:
+        normalIndices = intArrayToNumpy(group.normalIndices)
+        if normalIndices.min() >= 0:
+            (usedNormals, normalIndices) = compactIndices(normalIndices)
             if group.normalsHaveOwnIndices:
                 normalPrimvar = usdMesh.CreatePrimvar('normals', Sdf.ValueTypeNames.Normal3fArray, UsdGeom.Tokens.faceVarying)
-                normalPrimvar.Set(self.normals[minNormalIndex:maxNormalIndex+1])
-                if minNormalIndex == 0:  # optimization
-                    normalPrimvar.SetIndices(Vt.IntArray(group.normalIndices))
-                else:
-                    normalPrimvar.SetIndices(Vt.IntArray(list(map(lambda x: x - minNormalIndex, group.normalIndices))))
+                normalPrimvar.Set(Vt.Vec3fArray.FromNumpy(self.normals.take(usedNormals)))
+                normalPrimvar.SetIndices(Vt.IntArray.FromNumpy(normalIndices))
             else:
                 normalPrimvar = usdMesh.CreatePrimvar('normals', Sdf.ValueTypeNames.Normal3fArray, UsdGeom.Tokens.vertex)
-                normalPrimvar.Set(self.normals[minNormalIndex:maxNormalIndex+1])
+                normalPrimvar.Set(Vt.Vec3fArray.FromNumpy(self.normals.take(usedNormals)))
 
         # materials
         if len(group.subsets) == 1:
@@ -311,7 +554,7 @@ class ObjConverter:
                     subsetName = materialName + 'Subset'
                     if self.verbose:
                         print('  subset: ' + subsetName + ' faces: ' + str(len(subset.faces)))
-                    usdSubset = UsdShade.MaterialBindingAPI.CreateMaterialBindSubset(bindingAPI, subsetName, Vt.IntArray(subset.faces))
+                    usdSubset = UsdShade.MaterialBindingAPI.CreateMaterialBindSubset(bindingAPI, subsetName, Vt.IntArray.FromNumpy(intArrayToNumpy(subset.faces)))
                     UsdShade.MaterialBindingAPI(usdSubset).Bind(self.getUsdMaterial(materialIndex))
 
 
@@ -321,33 +564,36 @@ class ObjConverter:
         usdStage = usdMaterialWithObjMtl_module.usdMaterialWithObjMtl(self, filename)
 
 
+    def addParsedCommands(self, commands, objPath):
+        for command in commands:
+            if 'f' == command[0]:
+                self.addFaces(command[1], command[2])
+            elif 'g' == command[0]:
+                self.setGroup(command[1])
+            elif 'usemtl' == command[0]:
+                self.setMaterial(command[1])
+            elif 'mtllib' == command[0]:
+                if self.useMtl:
+                    filename = os.path.dirname(objPath) + '/' + command[1]
+                    self.loadMaterialsFromMTLFile(filename)
+            else:
+                self.addRecordValues(command[0], command[1])
+
+
     def parseObjFile(self, objPath):
-        with open(objPath, errors='ignore') as file:
-            for line in linesContinuation(file):
-                line = line.strip()
-                if not line or '#' == line[0]:
-                    continue
-
-                arguments = list(filter(None, line.split(' ')))
-                command = arguments[0]
-                arguments = arguments[1:]
-                
-                if 'v' == command:
-                    self.addVertex(arguments)
-                elif 'vt' == command:
-                    self.addUV(arguments)
-                elif 'vn' == command:
-                    self.addNormal(arguments)
-                elif 'f' == command:
-                    self.addFace(arguments)
-                elif 'g' == command or 'o' == command:
-                    self.setGroup(' '.join(arguments))
-                elif 'usemtl' == command:
-                    self.setMaterial(' '.join(arguments))
-                elif 'mtllib' == command:
-                    if self.useMtl:
-                        filename = os.path.dirname(objPath) + '/' + (' '.join(arguments))
-                        self.loadMaterialsFromMTLFile(filename)
+        fileSize = os.path.getsize(objPath)
+        if self.processes > 1 and fileSize > CHUNK_MIN_BYTES:
+            # chunks are parsed in parallel and added in file order, so negative indices and group and material changes resolve as usual
+            chunkCount = min(self.processes * CHUNKS_PER_PROCESS, fileSize // CHUNK_MIN_BYTES + 1)
+            chunks = splitObjFile(objPath, chunkCount)
+            if self.verbose:
+                print('  parsing ' + str(len(chunks)) + ' chunks with ' + str(self.processes) + ' processes')
+            with multiprocessing.Pool(self.processes) as pool:
+                for commands in pool.imap(parseObjChunk, chunks):
+                    self.addParsedCommands(commands, objPath)
+        else:
+            with open(objPath, errors='ignore') as file:
+                self.addParsedCommands(parseObjLines(linesContinuation(file)), objPath)
 
         self.checkLastSubsets()
 
@@ -378,6 +624,9 @@ class ObjConverter:
 
 
 def usdStageWithObj(objPath, usdPath, useMtl, openParameters):
+    if usdStageWithObjLoaded == False:
+        return None
+
     start = time.time()
     converter = ObjConverter(objPath, usdPath, useMtl, openParameters)
     usdStage = converter.makeUsdStage()
@@ -2,6 +2,8 @@ import os.path
 from shutil import copyfile
 import re
 import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pxr import *
 
 
@@ -54,12 +56,58 @@ def copy(srcFile, dstFile, verbose=False):
     if os.path.isfile(srcFile):
         dstFolder = os.path.dirname(dstFile)
         if dstFolder != '' and not os.path.isdir(dstFolder):
-            os.makedirs(dstFolder)
+            os.makedirs(dstFolder, exist_ok=True)
         copyfile(srcFile, dstFile)
     else:
         printWarning("can't find " + srcFile)
 
 
+def writeFile(dstFile, content):
+    with open(dstFile, 'wb') as file:
+        file.write(content)
+
+
+class FileWriter:
+    # writes and copies files on worker threads while conversion goes on
+    def __init__(self, verbose=False, maxWorkers=4, maxPending=16):
+        self.verbose = verbose
+        self._executor = ThreadPoolExecutor(max_workers=max(1, min(maxWorkers, os.cpu_count() or 1)))
+        self._pending = threading.BoundedSemaphore(maxPending) # back-pressure: submitting blocks while too many jobs are queued
+        self._jobs = {} # dstFile: future
+
+
+    def _submit(self, dstFile, function, *args):
+        if dstFile in self._jobs:
+            return
+        self._pending.acquire()
+        try:
+            job = self._executor.submit(function, *args)
+        except:
+            self._pending.release()
+            raise
+        job.add_done_callback(lambda job: self._pending.release())
+        self._jobs[dstFile] = job
+
+
+    def write(self, dstFile, content):
+        self._submit(dstFile, writeFile, dstFile, content)
+
+
+    def copy(self, srcFile, dstFile):
+        self._submit(dstFile, copy, srcFile, dstFile, self.verbose)
+
+
+    def wait(self, dstFile):
+        if dstFile in self._jobs:
+            self._jobs[dstFile].result()
+
+
+    def join(self):
+        self._executor.shutdown(wait=True)
+        for job in self._jobs.values():
+            job.result()
+
+
 def resolvePath(textureFileName, folder, searchPaths=None):
     if textureFileName == '':
         return ''
@@ -111,6 +159,7 @@ class Asset:
     materialsFolder = 'Materials'
     geomFolder = 'Geom'
     animationsFolder = 'Animations'
+    prototypesFolder = 'Prototypes'
 
     def __init__(self, usdPath, usdStage=None):
         fileName = os.path.basename(usdPath)
@@ -125,6 +174,7 @@ class Asset:
         self._geomPath = ''
         self._materialsPath = ''
         self._animationsPath = ''
+        self._prototypesPath = ''
 
 
     def getPath(self):
@@ -158,6 +208,16 @@ class Asset:
         return self._animationsPath
 
 
+    def getPrototypesPath(self):
+        # debug
+        # assert self.usdStage is not None, 'Using prototypes path before usdStage was created'
+        if not self._prototypesPath:
+            self._prototypesPath = self.getPath() + '/' + Asset.prototypesFolder
+            # class prim: prototypes are only rendered through their instances
+            self.usdStage.CreateClassPrim(self._prototypesPath)
+        return self._prototypesPath
+
+
     def setFPS(self, fps):
         # set one time code per frame
         self.timeCodesPerSecond = fps
@@ -577,6 +637,11 @@ class Skin:
         return self._toSkeletonIndices[str(index)]
 
 
+    def getSkeletonIndices(self):
+        # skeleton joint index for each skin joint, usable as a lookup table
+        return [self._toSkeletonIndices[str(jointIdx)] for jointIdx in range(len(self.joints))]
+
+
     # private:
     def _setSkeleton(self, skeleton):
         self.skeleton = skeleton
@@ -600,13 +665,11 @@ class Skeleton:
         self.usdSkeleton = None
         self.usdSkelAnim = None
         self.sdfPath = None
+        self._jointIndices = {} # use self.getJointIndex(joint)
 
 
     def getJointIndex(self, joint):
-        for jointIdx in range(len(self.joints)):
-            if joint == self.joints[jointIdx]:
-                return jointIdx
-        return -1
+        return self._jointIndices.get(joint, -1)
 
 
     def getRoot(self):
@@ -670,6 +733,8 @@ class Skeleton:
 
     # private:
     def _collectJoints(self, node, path, nodeManager):
+        if node not in self._jointIndices:
+            self._jointIndices[node] = len(self.joints)
         self.joints.append(node)
         name = nodeManager.overrideGetName(node)
         newPath = path + name
@@ -685,12 +750,19 @@ class Skinning:
         self.skeletons = []
         self.nodeManager = nodeManager
         self.joints = {} # joint set
+        self._skeletonsByJoint = {} # use self.findSkeletonByJoint(node), the first skeleton with the joint
+        self._skeletonsByRoot = {} # use self.findSkeletonByRoot(node)
 
 
     def createSkeleton(self, root):
         skeleton = Skeleton()
         skeleton._collectJoints(root, '', self.nodeManager)
         self.skeletons.append(skeleton)
+        for joint in skeleton.joints:
+            if joint not in self._skeletonsByJoint:
+                self._skeletonsByJoint[joint] = skeleton
+        if skeleton.getRoot() not in self._skeletonsByRoot:
+            self._skeletonsByRoot[skeleton.getRoot()] = skeleton
         return skeleton
 
 
@@ -718,7 +790,7 @@ class Skinning:
                             skin._setSkeleton(skeleton)
                     skeletonsToRemove.append(subSkeleton)
             for skeletonToRemove in skeletonsToRemove:
-                self.skeletons.remove(skeletonToRemove)
+                self._removeSkeleton(skeletonToRemove, skeleton)
 
 
         for skin in self.skins:
@@ -730,17 +802,23 @@ class Skinning:
 
 
     def findSkeletonByRoot(self, node):
-        for skeleton in self.skeletons:
-            if skeleton.getRoot() == node:
-                return skeleton
-        return None
+        return self._skeletonsByRoot.get(node)
 
 
     def findSkeletonByJoint(self, node):
-        for skeleton in self.skeletons:
-            if skeleton.getJointIndex(node) != -1:
-                return skeleton
-        return None
+        return self._skeletonsByJoint.get(node)
+
+
+    # private:
+    def _removeSkeleton(self, subSkeleton, skeleton):
+        # joints of merged sub-skeleton belong to the skeleton which contains it
+        self.skeletons.remove(subSkeleton)
+        for joint in subSkeleton.joints:
+            if self._skeletonsByJoint.get(joint) is subSkeleton:
+                self._skeletonsByJoint[joint] = skeleton
+        root = subSkeleton.getRoot()
+        if self._skeletonsByRoot.get(root) is subSkeleton:
+            del self._skeletonsByRoot[root]
 
 
 